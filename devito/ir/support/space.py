@@ -512,8 +512,18 @@ class IntervalGroup(Ordering):
         return IntervalGroup(intervals, relations=relations, mode=self.mode)
 
     def translate(self, d, v0=0, v1=None):
-        dims = as_tuple(d)
-        intervals = [i.translate(v0, v1) if i.dim in dims else i for i in self]
+        """
+        Translate the Intervals along the Dimension(s) `d` by `v0` (lower bound)
+        and `v1` (upper bound, defaults to `v0`). Alternatively, `d` may be a
+        mapper `{Dimension -> v0}`, to translate several Intervals by different
+        amounts, in a single pass.
+        """
+        if isinstance(d, dict):
+            mapper = {k: (v, v1) for k, v in d.items()}
+        else:
+            mapper = {k: (v0, v1) for k in as_tuple(d)}
+        intervals = [i.translate(*mapper[i.dim]) if i.dim in mapper else i
+                     for i in self]
 
         return IntervalGroup(intervals, relations=self.relations, mode=self.mode)
 
@@ -31,6 +31,12 @@ class SymbolRegistry(object):
         self.caches = {}
 
     def make_name(self, prefix=None):
+        return self.make_names(prefix=prefix)[0]
+
+    def make_names(self, prefix=None, n=1):
+        """
+        Create `n` unique names at once, all sharing the same `prefix`.
+        """
         # By default we're creating a new symbol
         if prefix is None:
             prefix = self._symbol_prefix
@@ -40,7 +46,7 @@ class SymbolRegistry(object):
         except KeyError:
             counter = self.counters.setdefault(prefix, generator())
 
-        return "%s%d" % (prefix, counter())
+        return ["%s%d" % (prefix, counter()) for _ in range(n)]
 
     def make_npthreads(self, size):
         name = self.make_name(prefix='npthreads')
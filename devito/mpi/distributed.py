@@ -5,6 +5,7 @@ from math import ceil, pow
 from sympy import factorint
 
 import atexit
+import weakref
 
 from cached_property import cached_property
 import numpy as np
@@ -12,7 +13,7 @@ from cgen import Struct, Value
 
 from devito.data import LEFT, CENTER, RIGHT, Decomposition
 from devito.parameters import configuration
-from devito.tools import EnrichedTuple, as_tuple, ctypes_to_cstr, filter_ordered
+from devito.tools import EnrichedTuple, as_tuple, ctypes_to_cstr
 from devito.types import CompositeObject, Object
 from devito.types.utils import DimensionTuple
 
@@ -63,6 +64,14 @@ except ImportError:
 __all__ = ['Distributor', 'SparseDistributor', 'MPI', 'CustomTopology']
 
 
+def free_comm(comm):
+    """
+    Free the MPI communicator `comm`, unless MPI has already been finalized.
+    """
+    if not MPI.Is_finalized():
+        comm.Free()
+
+
 class AbstractDistributor(ABC):
 
     """
@@ -330,6 +339,26 @@ class Distributor(AbstractDistributor):
             ret[d] = tuple(v)
         return ret
 
+    @cached_property
+    def _glb_to_coords(self):
+        """
+        For each Dimension, a table mapping each global index to the cartesian
+        coordinate, along that Dimension, of the MPI rank owning it.
+        """
+        return tuple(np.repeat(np.arange(len(dec)), [len(b) for b in dec])
+                     for dec in self.decomposition)
+
+    @cached_property
+    def _coords_to_rank(self):
+        """
+        A table mapping the cartesian coordinates of each MPI rank to the MPI
+        rank itself.
+        """
+        ret = np.empty(self.topology, dtype=int)
+        for r, c in enumerate(self.all_coords):
+            ret[c] = r
+        return ret
+
     def glb_to_rank(self, index):
         """
         The MPI rank owning a given global index.
@@ -353,15 +382,37 @@ class Distributor(AbstractDistributor):
         if len(index.shape) == 2:
             index = np.expand_dims(index, axis=2)
 
-        ret = {}
-        for r, j in enumerate(self.all_ranges):
-            mins = np.array([b[0] for b in j]).reshape(1, -1, 1)
-            maxs = np.array([b[-1] for b in j]).reshape(1, -1, 1)
-            inds = np.where(((index <= maxs) & (index >= mins)).all(axis=1))
-            if inds[0].size == 0:
-                continue
-            ret[r] = filter_ordered(inds[0])
-        return ret
+        # The cartesian coordinates of the MPI rank owning each index, retrieved
+        # through a table lookup along each Dimension
+        coords = []
+        valid = np.ones(index[:, 0].shape, dtype=bool)
+        items = zip(np.moveaxis(index, 1, 0), self._glb_to_coords, self.glb_shape)
+        for i, table, s in items:
+            coords.append(table[np.clip(i, 0, s - 1)])
+            valid &= (i >= 0) & (i < s)
+
+        ranks = self._coords_to_rank[tuple(coords)]
+
+        # Bucket the indices by owning rank, deduplicating them along the way.
+        # The support of a sparse point typically lies within one or very few
+        # MPI ranks, so the duplicates are first dropped with a cheap pass over
+        # each point's (few) owners, which makes the subsequent sort of the
+        # (rank, point) pairs much smaller
+        ranks[~valid] = -1
+        ranks.sort(axis=1)
+        keep = ranks >= 0
+        keep[:, 1:] &= ranks[:, 1:] != ranks[:, :-1]
+
+        npoint = index.shape[0]
+        inds = np.broadcast_to(np.arange(npoint).reshape(-1, 1), ranks.shape)
+        keys = np.sort(ranks[keep]*npoint + inds[keep])
+        if keys.size == 0:
+            return {}
+        ranks, inds = np.divmod(keys, npoint)
+        splits = np.flatnonzero(np.diff(ranks)) + 1
+
+        return {int(r[0]): i
+                for r, i in zip(np.split(ranks, splits), np.split(inds, splits))}
 
     @property
     def neighborhood(self):
@@ -408,6 +459,18 @@ class Distributor(AbstractDistributor):
         """An Object representing the MPI communicator."""
         return MPICommObject(self.comm)
 
+    @cached_property
+    def _sparse_comm(self):
+        """
+        A duplicate of the MPI communicator, reserved to the point-to-point
+        exchanges of the sparse functions, which thus cannot match any unrelated
+        message sent over `comm`. It's freed along with `self`, as the MPI
+        context ids are a limited resource.
+        """
+        comm = self.comm.Dup()
+        weakref.finalize(self, free_comm, comm)
+        return comm
+
     @cached_property
     def _obj_neighborhood(self):
         """
@@ -482,6 +545,10 @@ class SparseDistributor(AbstractDistributor):
     def comm(self):
         return self.distributor._comm
 
+    @property
+    def _sparse_comm(self):
+        return self.distributor._sparse_comm
+
     @property
     def myrank(self):
         return self.distributor.myrank
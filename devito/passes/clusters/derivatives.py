@@ -1,14 +1,23 @@
+from weakref import WeakValueDictionary
+
 from devito.finite_differences import IndexDerivative
 from devito.ir import Backward, Forward, Interval, IterationSpace, Queue
 from devito.passes.clusters.misc import fuse
-from devito.symbolics import (retrieve_dimensions, reuse_if_untouched, q_leaf,
-                              uxreplace)
+from devito.symbolics import reuse_if_untouched, q_leaf, search, uxreplace
 from devito.tools import filter_ordered, timed_pass
 from devito.types import Eq, Inc, StencilDimension, Symbol
 
 __all__ = ['lower_index_derivatives']
 
 
+# The Intervals over the StencilDimensions, interned as they are structurally
+# identical across all of the IndexDerivatives and all of the Clusters
+_intervals = WeakValueDictionary()
+
+# {type -> bool}, the leaf-ness of the expression types, see `_q_leaf`
+_leaves = {}
+
+
 @timed_pass()
 def lower_index_derivatives(clusters, mode=None, **kwargs):
     clusters, weights, mapper = _lower_index_derivatives(clusters, **kwargs)
@@ -29,7 +38,12 @@ def lower_index_derivatives(clusters, mode=None, **kwargs):
 
 
 def _lower_index_derivatives(clusters, sregistry=None, **kwargs):
+    # {(id(w0), dtype) -> w}
     weights = {}
+    # The memoized helpers' results, see `_stencil_dims` and `_uxreplace_cached`.
+    # These only live as long as a single run of the pass, lest they keep the
+    # user Functions alive
+    cache = {}
     processed = []
     mapper = {}
 
@@ -39,16 +53,24 @@ def _lower_index_derivatives(clusters, sregistry=None, **kwargs):
             exprs[:] = []
 
     for c in clusters:
+        # {StencilDimensions -> IterationSpaces}, shared by all of the
+        # IndexDerivatives within `c`
+        ispaces = {}
+
         exprs = []
         for e in c.exprs:
             # Optimization 1: if the LHS is already a Symbol, then surely it's
-            # usable as a temporary for one of the IndexDerivatives inside `e`
+            # usable as a temporary for one of the IndexDerivatives inside `e`.
+            # Note: conversely, the temporaries of the previous expressions are
+            # deliberately NOT recycled, as the ensuing anti-dependences would
+            # prevent the fusion of the reductions over the StencilDimensions
             if e.lhs.is_Symbol and e.operation is None:
                 reusable = {e.lhs}
             else:
                 reusable = set()
 
-            expr, v = _core(e, c, weights, reusable, mapper, sregistry)
+            expr, v = _core(e, c, ispaces, weights, reusable, mapper, cache,
+                            sregistry)
 
             if v:
                 dump(exprs, c)
@@ -70,79 +92,212 @@ def _lower_index_derivatives(clusters, sregistry=None, **kwargs):
     return processed, weights, mapper
 
 
-def _core(expr, c, weights, reusables, mapper, sregistry):
+def _core(expr, c, ispaces, weights, reusables, mapper, cache, sregistry):
     """
-    Recursively carry out the core of `lower_index_derivatives`.
+    Carry out the core of `lower_index_derivatives`.
+
+    The expression tree is visited in post-order through an explicit stack. The
+    visited nodes are memoized by identity, so that a sub-expression shared by
+    multiple nodes (e.g., `p.dx` in `(p.dx + m.dx).dx + p.dx`) gets lowered
+    only once.
     """
-    if q_leaf(expr):
+    # Nothing to lower -- quick exit to avoid the whole tree walk below
+    if not expr.has(IndexDerivative):
         return expr, []
 
-    args = []
-    processed = []
-    for a in expr.args:
-        e, clusters = _core(a, c, weights, reusables, mapper, sregistry)
-        args.append(e)
-        processed.extend(clusters)
+    # {id(node) -> (new node, clusters induced by the lowering of node)}
+    memo = {}
+
+    # {IterationSpace -> zero-initializations of the temporaries}
+    inits = {}
+
+    # Compute the post-order of the unique non-leaf nodes
+    order = []
+    stack = [(expr, False)]
+    while stack:
+        node, visited = stack.pop()
+
+        if visited:
+            order.append(node)
+        elif id(node) not in memo:
+            if _q_leaf(node):
+                memo[id(node)] = (node, [])
+            else:
+                memo[id(node)] = None
+                stack.append((node, True))
+                stack.extend((a, False) for a in reversed(node.args))
+
+    # Each IndexDerivative requires a temporary, so we can create all of the
+    # names upfront, except for those temporaries that can be reused
+    nids = sum(isinstance(i, IndexDerivative) for i in order)
+    names = iter(sregistry.make_names(prefix='r', n=max(nids - len(reusables), 0)))
+
+    for node in order:
+        args = []
+        processed = []
+        for a in node.args:
+            v, clusters = memo[id(a)]
+            args.append(v)
+            processed.extend(clusters)
+            # The induced clusters must be emitted only once, regardless of
+            # how many nodes share `a`
+            memo[id(a)] = (v, [])
+
+        v = reuse_if_untouched(node, args)
 
-    expr = reuse_if_untouched(expr, args)
+        if isinstance(v, IndexDerivative):
+            v = _lower_index_derivative(v, c, processed, inits, ispaces,
+                                        weights, reusables, names, mapper,
+                                        cache, sregistry)
 
-    if not isinstance(expr, IndexDerivative):
-        return expr, processed
+        memo[id(node)] = (v, processed)
+
+    expr, processed = memo[id(expr)]
+
+    # The temporaries are all distinct, and none of them is accessed before its
+    # own initialization, so the initializations outside of any StencilDimension
+    # may be hoisted and emitted through a single Cluster per IterationSpace
+    processed = [c.rebuild(exprs=v, ispace=k) for k, v in inits.items()] + processed
+
+    return expr, processed
+
+
+def _lower_index_derivative(expr, c, processed, inits, ispaces, weights,
+                            reusables, names, mapper, cache, sregistry):
+    """
+    Lower the IndexDerivative `expr` into a temporary Symbol. The Clusters
+    computing such a temporary are added to `processed`, while its
+    initialization is added to `inits` unless it must be carried out within
+    the StencilDimensions of an outer IndexDerivative.
+    """
+    # Create concrete Weights and reuse them whenever possible. The fast path
+    # looks up `w0` by identity, thus sparing the hashing of all of the weight
+    # values; the slow path compares the actual weight values, so that distinct
+    # but numerically identical Weights still share the same concrete Function.
+    # The latter are tracked by the SymbolRegistry, so they are shared by all
+    # compiler passes
+    dtype = expr.dtype
 
-    # Create concrete Weights and reuse them whenever possible
-    name = sregistry.make_name(prefix='w')
     w0 = expr.weights.function
-    k = tuple(w0.weights)
+    k0 = (id(w0), dtype)
     try:
-        w = weights[k]
+        w = weights[k0]
     except KeyError:
-        w = weights[k] = w0._rebuild(name=name, dtype=expr.dtype)
-    expr = uxreplace(expr, {w0.indexed: w.indexed})
-
-    dims = retrieve_dimensions(expr, deep=True)
-    dims = filter_ordered(d for d in dims if isinstance(d, StencilDimension))
-
-    dims = tuple(reversed(dims))
+        k1 = (tuple(w0.weights), dtype)
+        try:
+            w = sregistry.get('weights', k1)
+        except KeyError:
+            name = sregistry.make_name(prefix='w')
+            w = sregistry.setdefault('weights', k1,
+                                     w0._rebuild(name=name, dtype=dtype))
+        weights[k0] = w
+    expr = _uxreplace_cached(expr, ((w0.indexed, w.indexed),), cache)
+
+    dims = _stencil_dims(expr, cache)
 
     # If a StencilDimension already appears in `c.ispace`, perhaps with its custom
     # upper and lower offsets, we honor it
     dims = tuple(d for d in dims if d not in c.ispace)
 
-    intervals = [Interval(d) for d in dims]
-    directions = {d: Backward if d.backward else Forward for d in dims}
-    ispace0 = IterationSpace(intervals, directions=directions)
+    # The IterationSpaces only depend on `dims`, hence they are shared by all
+    # IndexDerivatives within `c` over the same StencilDimensions
+    try:
+        ispace, ispace1 = ispaces[dims]
+    except KeyError:
+        intervals = [_interval(d) for d in dims]
+        directions = {d: Backward if d.backward else Forward for d in dims}
+        ispace0 = IterationSpace(intervals, directions=directions)
 
-    extra = (c.ispace.itdims + dims,)
-    ispace = IterationSpace.union(c.ispace, ispace0, relations=extra)
+        extra = (c.ispace.itdims + dims,)
+        ispace = IterationSpace.union(c.ispace, ispace0, relations=extra)
 
-    # Set the IterationSpace along the StencilDimensions to start from 0
-    # (rather than the default `d._min`) to minimize the amount of integer
-    # arithmetic to calculate the various index access functions
-    for d in dims:
-        ispace = ispace.translate(d, -d._min)
+        # Set the IterationSpace along the StencilDimensions to start from 0
+        # (rather than the default `d._min`) to minimize the amount of integer
+        # arithmetic to calculate the various index access functions
+        ispace = ispace.translate({d: -d._min for d in dims})
 
-    try:
+        ispace1 = ispace.project(lambda d: d is not dims[-1])
+
+        ispaces[dims] = ispace, ispace1
+
+    if reusables:
         s = reusables.pop()
-        assert s.dtype is w.dtype
-    except KeyError:
-        name = sregistry.make_name(prefix='r')
-        s = Symbol(name=name, dtype=w.dtype)
+        assert s.dtype is dtype
+    else:
+        s = Symbol(name=next(names), dtype=dtype)
     expr0 = Eq(s, 0.)
-    ispace1 = ispace.project(lambda d: d is not dims[-1])
-    processed.insert(0, c.rebuild(exprs=expr0, ispace=ispace1))
+    if len(dims) == 1:
+        inits.setdefault(ispace1, []).append(expr0)
+    else:
+        # A nested IndexDerivative -- the temporary must be reset at each
+        # iteration of the outer StencilDimensions
+        processed.insert(0, c.rebuild(exprs=expr0, ispace=ispace1))
 
     # Transform e.g. `r0[x + i0 + 2, y] -> r0[x + i0, y, z]` for alignment
     # with the shifted `ispace`
-    base = expr.base
-    for d in dims:
-        base = base.subs(d, d + d._min)
+    base = expr.base.xreplace({d: d + d._min for d in dims})
     expr1 = Inc(s, base*expr.weights)
     processed.append(c.rebuild(exprs=expr1, ispace=ispace))
 
-    # Track lowered IndexDerivative for subsequent optimization by the caller
+    # Track lowered IndexDerivative for subsequent optimization by the caller.
+    # Note: the key must be structural, not an identity, since the caller is
+    # after distinct IndexDerivatives that turn out to be equal once lowered.
+    # This is inexpensive anyway, as SymPy caches the hash of `expr1.rhs`, so
+    # the expression tree is hashed only once
     mapper.setdefault(expr1.rhs, []).append(s)
 
-    return s, processed
+    return s
+
+
+def _q_leaf(expr):
+    """
+    A `q_leaf` memoized by type, since leaf-ness only depends on the class of
+    `expr`, while `_core` performs one such query per node.
+    """
+    try:
+        return _leaves[type(expr)]
+    except KeyError:
+        return _leaves.setdefault(type(expr), q_leaf(expr))
+
+
+def _interval(d):
+    """
+    The interned Interval over the StencilDimension `d`.
+    """
+    try:
+        return _intervals[d]
+    except KeyError:
+        return _intervals.setdefault(d, Interval(d))
+
+
+def _stencil_dims(expr, cache):
+    """
+    The StencilDimensions of the IndexDerivative `expr`, outermost first. Memoized
+    in `cache`, as the same IndexDerivative may be lowered several times.
+
+    Note: the StencilDimensions must be searched in the whole expression, since
+    the base of a nested IndexDerivative may also index into the StencilDimensions
+    of the outer IndexDerivatives (e.g., `p[x + i0, y + i1]` in `p.dx.dy`).
+    """
+    key = ('stencil_dims', expr)
+    try:
+        return cache[key]
+    except KeyError:
+        dims = search(expr, StencilDimension, 'all', 'dfs', deep=True)
+        return cache.setdefault(key, tuple(reversed(filter_ordered(dims))))
+
+
+def _uxreplace_cached(expr, rule, cache):
+    """
+    A `uxreplace` memoized in `cache`, with `rule` provided as a tuple of pairs.
+    Useful as the same IndexDerivative may be lowered several times, e.g. when it
+    appears in multiple expressions.
+    """
+    key = ('uxreplace', expr, rule)
+    try:
+        return cache[key]
+    except KeyError:
+        return cache.setdefault(key, uxreplace(expr, dict(rule)))
 
 
 class CDE(Queue):
@@ -154,16 +309,29 @@ class CDE(Queue):
     def __init__(self, mapper):
         super().__init__()
 
+        # Note: `mapper` must be keyed structurally, not by identity, as distinct
+        # lowered IndexDerivatives may be equal (see `_lower_index_derivative`).
+        # The membership tests in `callback` are O(1) anyway, as SymPy caches the
+        # hash of the expressions
         self.mapper = {k: v for k, v in mapper.items() if len(v) > 1}
 
     def process(self, clusters):
+        # No redundant derivatives -- nothing to eliminate
+        if not self.mapper:
+            return clusters
+
         return self._process_fdta(clusters, 1, subs0={}, seen=set())
 
     def callback(self, clusters, prefix, subs0=None, seen=None):
         subs = {}
         processed = []
+
+        # The merged substitution rule is rebuilt lazily, only after either
+        # `subs0` or `subs` have changed
+        rule = None
+
         for c in clusters:
-            if c in seen:
+            if id(c) in seen:
                 processed.append(c)
                 continue
 
@@ -176,18 +344,28 @@ class CDE(Queue):
 
                 try:
                     subs0[k] = subs[v]
+                    rule = None
                     continue
                 except KeyError:
                     pass
 
                 if v in self.mapper:
                     subs[v] = k
+                    rule = None
                     exprs.append(e)
                 else:
-                    exprs.append(uxreplace(e, {**subs0, **subs}))
+                    if rule is None:
+                        rule = {**subs0, **subs}
+                    if rule:
+                        exprs.append(uxreplace(e, rule))
+                    else:
+                        exprs.append(e)
 
             processed.append(c.rebuild(exprs=exprs))
 
-        seen.update(processed)
+        # Clusters are tracked by identity, which is safe as they are all kept
+        # alive by `processed` until the end of the pass, while avoiding the
+        # expensive Cluster hashing
+        seen.update(id(c) for c in processed)
 
         return processed
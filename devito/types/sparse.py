@@ -5,6 +5,7 @@ except ImportError:
     # Before python 3.10
     from collections import Iterable
 from itertools import product
+import weakref
 
 import sympy
 import numpy as np
@@ -12,10 +13,11 @@ from cached_property import cached_property
 
 from devito.finite_differences import generate_fd_shortcuts
 from devito.mpi import MPI, SparseDistributor
+from devito.mpi.distributed import free_comm
 from devito.operations import LinearInterpolator, PrecomputedInterpolator
 from devito.symbolics import indexify, retrieve_function_carriers
-from devito.tools import (ReducerMap, as_tuple, flatten, prod, filter_ordered,
-                          is_integer, dtype_to_mpidtype)
+from devito.tools import (ReducerMap, as_tuple, prod, filter_ordered,
+                          is_integer, dtype_to_mpidtype, memoized_func)
 from devito.types.dense import DiscreteFunction, SubFunction
 from devito.types.dimension import (Dimension, ConditionalDimension, DefaultDimension,
                                     DynamicDimension)
@@ -29,6 +31,85 @@ __all__ = ['SparseFunction', 'SparseTimeFunction', 'PrecomputedSparseFunction',
            'PrecomputedSparseTimeFunction', 'MatrixSparseTimeFunction']
 
 
+# The position Symbols along the grid Dimensions, interned as they are shared
+# by all sparse functions over the same grid. The Symbols are only referenced
+# weakly, so that they may still be freed by `clear_cache`
+_positions = weakref.WeakValueDictionary()
+
+
+@memoized_func
+def point_increments(r, ndim):
+    """
+    The index increments, in each of the `ndim` Dimensions, of the grid points
+    a sparse point with radius `r` is interpolated from or injected into.
+    Memoized, as these are shared by all sparse functions with the same radius
+    over grids with the same number of Dimensions.
+    """
+    return tuple(product(range(-r+1, r+1), repeat=ndim))
+
+
+@memoized_func
+def point_support(r, ndim):
+    """
+    Same as `point_increments`, but as a read-only ``numpy.ndarray``.
+    """
+    ret = np.array(point_increments(r, ndim))
+    ret.setflags(write=False)
+    return ret
+
+
+def morton_codes(indices):
+    """
+    The Z-order (Morton) codes of the given grid indices, an array of shape
+    `(npoint, ndim)`, obtained by interleaving the bits of the indices along
+    each Dimension.
+    """
+    indices = indices - indices.min(axis=0, initial=0)
+    npoint, ndim = indices.shape
+
+    nbits = int(indices.max(initial=0)).bit_length()
+    if nbits*ndim > 64:
+        # Not representable -- drop the least significant bits, which only
+        # affects the ordering of the sparse points within the same cluster
+        shift = nbits - 64 // ndim
+        indices = indices >> shift
+        nbits -= shift
+
+    indices = indices.astype(np.uint64)
+    codes = np.zeros(npoint, dtype=np.uint64)
+    for b in range(nbits):
+        for d in range(ndim):
+            codes |= ((indices[:, d] >> np.uint64(b)) & np.uint64(1)) << \
+                np.uint64(b*ndim + d)
+
+    return codes
+
+
+def position_symbol(d):
+    """
+    The interned integer Symbol holding the grid position of a sparse point
+    along the Dimension `d`.
+    """
+    try:
+        return _positions[d]
+    except KeyError:
+        return _positions.setdefault(d, Symbol(name='pos%s' % d, dtype=np.int32))
+
+
+class CompletedRequest(object):
+
+    """
+    A stand-in for an MPI request that has already completed, returned by the
+    nonblocking routines when there's nothing to communicate (e.g., without MPI).
+    """
+
+    def Wait(self, status=None):
+        pass
+
+    def Test(self, status=None):
+        return True
+
+
 class AbstractSparseFunction(DiscreteFunction):
 
     """
@@ -44,6 +125,12 @@ class AbstractSparseFunction(DiscreteFunction):
     _sub_functions = ()
     """SubFunctions encapsulated within this AbstractSparseFunction."""
 
+    _dist_count_sparsity = 0.25
+    """
+    Maximum fraction of MPI ranks exchanging sparse points with any given MPI
+    rank for the sparse point counts to be exchanged via `_dist_count_sparse`.
+    """
+
     __rkwargs__ = DiscreteFunction.__rkwargs__ + ('npoint_global', 'space_order')
 
     def __init_finalize__(self, *args, **kwargs):
@@ -147,11 +234,20 @@ class AbstractSparseFunction(DiscreteFunction):
                                  (suffix, key.shape[:2], shape))
 
             # Infer dtype
+            # Note: the floating-point SubFunctions, such as the coordinates,
+            # are never demoted below `self.dtype` (e.g., to half precision).
+            # The coordinates are absolute, not relative to a grid cell, so an
+            # 11-bit mantissa would already misplace the sparse points by one or
+            # more grid cells a few thousand grid spacings away from the origin
             if np.issubdtype(key.dtype.type, np.integer):
                 dtype = dtype or np.int32
             else:
                 dtype = dtype or self.dtype
 
+        # Note: the sparse Dimension is deliberately the outermost one, as all of
+        # the SubFunction values of a sparse point (e.g., its coordinates) are
+        # accessed together, both in the generated code and when exchanging
+        # contiguous sparse points across MPI ranks
         sf = SubFunction(
             name=name, dtype=dtype, dimensions=dimensions,
             shape=shape, space_order=0, initializer=key, alias=self.alias,
@@ -197,9 +293,11 @@ class AbstractSparseFunction(DiscreteFunction):
             if self.coordinates_data is None:
                 raise ValueError("No coordinates or gridpoints attached"
                                  "to this SparseFunction")
-            return (
-                np.floor((self.coordinates_data - self.grid.origin) / self.grid.spacing)
-            ).astype(int)
+            # Vectorized, with the intermediate results computed in place to
+            # avoid a temporary array per arithmetic operation
+            ci = self.coordinates_data - self.grid.origin
+            ci /= self.grid.spacing
+            return np.floor(ci, out=ci).astype(int)
 
     @property
     def _support(self):
@@ -207,17 +305,39 @@ class AbstractSparseFunction(DiscreteFunction):
         The grid points surrounding each sparse point within the radius of self's
         injection/interpolation operators.
         """
-        max_shape = np.array(self.grid.shape).reshape(1, self.grid.dim)
-        minmax = lambda arr: np.minimum(max_shape, np.maximum(0, arr))
-        return np.stack([minmax(self._coords_indices + s) for s in self._point_support],
-                        axis=2)
+        # A single broadcast, yielding an array of shape `(npoint, dim, nsupport)`
+        support = self._coords_indices[:, :, None] + self._point_support.T[None, :, :]
+        max_shape = np.array(self.grid.shape).reshape(1, self.grid.dim, 1)
+        return np.clip(support, 0, max_shape, out=support)
 
     @property
     def _dist_datamap(self):
         """
         Mapper ``M : MPI rank -> required sparse data``.
         """
-        return self.grid.distributor.glb_to_rank(self._support) or {}
+        # The mapper only depends on the grid points nearest to the sparse
+        # points, so it's only recomputed if these have changed since the last
+        # call (e.g., the user has moved the sparse points)
+        ci = self._coords_indices
+        try:
+            ci0, dmap = self._dist_datamap_memo
+            if np.array_equal(ci, ci0):
+                return dmap
+        except AttributeError:
+            pass
+
+        dmap = self.grid.distributor.glb_to_rank(self._support) or {}
+
+        # Note: the sparse data values are packed via `np.take(..., mode='clip')`,
+        # so the indices are validated once here rather than upon each scatter
+        if not all(0 <= i.min() and i.max() < self.npoint for i in dmap.values()):
+            raise ValueError("The data distribution map of `%s` references sparse "
+                             "points out of the range [0, %d)" % (self.name, self.npoint))
+
+        # Note: `ci` may be a view of the user-provided gridpoints, hence the copy
+        self._dist_datamap_memo = (np.array(ci), dmap)
+
+        return dmap
 
     @property
     def npoint(self):
@@ -272,17 +392,16 @@ class AbstractSparseFunction(DiscreteFunction):
 
     @cached_property
     def _pos_symbols(self):
-        return [Symbol(name='pos%s' % d, dtype=np.int32)
-                for d in self.grid.dimensions]
+        return [position_symbol(d) for d in self.grid.dimensions]
 
-    @cached_property
+    @property
     def _point_increments(self):
         """Index increments in each Dimension for each point symbol."""
-        return tuple(product(range(-self.r+1, self.r+1), repeat=self.grid.dim))
+        return point_increments(self.r, self.grid.dim)
 
-    @cached_property
+    @property
     def _point_support(self):
-        return np.array(self._point_increments)
+        return point_support(self.r, self.grid.dim)
 
     @cached_property
     def _position_map(self):
@@ -306,10 +425,38 @@ class AbstractSparseFunction(DiscreteFunction):
                      if d is not self._sparse_dim)
         return ret
 
+    @cached_property
+    def _dist_alltoall_memo(self):
+        """
+        The ``MPI_Alltoallv`` metadata of the sparse data values and of the
+        SubFunctions, alongside the sparse point counts they were derived from.
+        The metadata are reused by all exchanges as long as the sparse point
+        counts haven't changed, which is typically the case across Operator
+        applications.
+        """
+        return {}
+
+    @cached_property
+    def _is_reorder_identity(self):
+        """
+        True if ``self._sparse_position`` is already at the front, that is if
+        no reordering is necessary to pack and unpack the sparse data values.
+        """
+        return self._dist_reorder_mask == tuple(range(self.ndim))
+
     @cached_property
     def dist_origin(self):
         return self._dist_origin
 
+    @cached_property
+    def _dist_origin_offsets(self):
+        """
+        The values in ``self.dist_origin`` as arrays of the SubFunction's dtype,
+        ready to be broadcast against the SubFunction values.
+        """
+        return {k: None if v is None else np.array(v, dtype=k.dtype)
+                for k, v in self.dist_origin.items()}
+
     def interpolate(self, *args, **kwargs):
         """
         Implement an interpolation operation from the grid onto the given sparse points
@@ -322,6 +469,38 @@ class AbstractSparseFunction(DiscreteFunction):
         """
         return self.interpolator.inject(*args, **kwargs)
 
+    def reorder_by_locality(self):
+        """
+        Reorder, in place, the sparse points along a Z-order (Morton) curve
+        through the grid cells they fall in, so that sparse points close to each
+        other in space are also close to each other in memory. With MPI, this
+        makes the sparse points sent to, or received from, a given MPI rank
+        contiguous, which reduces the cost of packing and unpacking the data
+        exchanged by the Operators.
+
+        Both the sparse data values and the SubFunctions, such as the
+        coordinates, are permuted. With MPI, each MPI rank only permutes the
+        sparse points it physically owns.
+
+        Returns
+        -------
+        numpy.ndarray
+            The permutation applied to the (locally owned) sparse points, that
+            is the i-th sparse point is what used to be the `perm[i]`-th one.
+        """
+        perm = np.argsort(morton_codes(self._coords_indices), kind='stable')
+
+        data = self.data._local.view(np.ndarray)
+        data[:] = np.take(data, perm, axis=self._sparse_position)
+
+        for i in self._sub_functions:
+            subfunc = getattr(self, i)
+            if subfunc is not None:
+                sfuncd = subfunc.data._local.view(np.ndarray)
+                sfuncd[:] = sfuncd[perm]
+
+        return perm
+
     def guard(self, expr=None):
         """
         Generate guarded expressions, that is expressions that are evaluated
@@ -372,11 +551,40 @@ class AbstractSparseFunction(DiscreteFunction):
         the boundary of two or more MPI ranks are duplicated.
         """
         dmap = dmap or self._dist_datamap
-        mask = np.array(flatten(dmap[i] for i in sorted(dmap)), dtype=int)
+        if dmap:
+            mask = np.concatenate([dmap[i] for i in sorted(dmap)])
+        else:
+            mask = np.array([], dtype=int)
         ret = [slice(None) for _ in range(self.ndim)]
         ret[self._sparse_position] = mask
         return tuple(ret)
 
+    def _dist_gather_mask(self, dmap=None):
+        """
+        Like `_dist_scatter_mask`, but to write the gathered sparse data values
+        back into ``self.data``. Whenever the sparse data values are gathered from
+        a contiguous range of sparse points, e.g. because they all belong to the
+        same MPI rank, the indices are replaced by a slice, which spares the
+        more expensive fancy indexing. Memoized, as it only depends on `dmap`.
+        """
+        dmap = dmap or self._dist_datamap
+        try:
+            dmap0, ret = self._dist_gather_mask_memo
+            if dmap is dmap0:
+                return ret
+        except AttributeError:
+            pass
+
+        ret = list(self._dist_scatter_mask(dmap=dmap))
+        inds = ret[self._sparse_position]
+        if inds.size > 0 and np.all(np.diff(inds) == 1):
+            ret[self._sparse_position] = slice(inds[0], inds[-1] + 1)
+        ret = tuple(ret)
+
+        self._dist_gather_mask_memo = (dmap, ret)
+
+        return ret
+
     def _dist_count(self, dmap=None):
         """
         A 2-tuple of comm-sized iterables, which tells how many sparse points
@@ -385,205 +593,456 @@ class AbstractSparseFunction(DiscreteFunction):
         dmap = dmap or self._dist_datamap
         comm = self._comm
 
-        ssparse = np.array([len(dmap.get(i, [])) for i in range(comm.size)], dtype=int)
-        rsparse = np.empty(comm.size, dtype=int)
-        comm.Alltoall(ssparse, rsparse)
+        # The counts are invariant as long as no MPI rank has changed its data
+        # distribution map since the last call, in which case they aren't
+        # exchanged again
+        try:
+            dmap0, counts = self._dist_count_memo
+        except AttributeError:
+            dmap0, counts = None, None
+        if not comm.allreduce(dmap is not dmap0, op=MPI.LOR):
+            return counts
+
+        # Only the MPI ranks in `dmap` receive any sparse points, so there's no
+        # need to loop over all of the MPI ranks
+        ssparse = np.zeros(comm.size, dtype=int)
+        ssparse[list(dmap)] = [len(v) for v in dmap.values()]
+
+        # Typically, the sparse points only need to be exchanged with a handful
+        # of neighboring MPI ranks, in which case a dense Alltoall is overkill.
+        # Note: all MPI ranks must agree on the communication pattern, hence
+        # the reduction
+        if comm.allreduce(len(dmap), op=MPI.MAX) < self._dist_count_sparsity*comm.size:
+            rsparse = self._dist_count_sparse(ssparse)
+
+            # Likewise, the sparse points will be exchanged through neighborhood
+            # collectives, over the MPI ranks actually exchanging sparse points.
+            # Note: this is a symmetric graph, as an MPI rank sends sparse points
+            # to those MPI ranks it will later receive them back from
+            neighbors = np.flatnonzero(ssparse + rsparse)
+            topology = (comm.Create_dist_graph_adjacent(neighbors.tolist(),
+                                                        neighbors.tolist(),
+                                                        reorder=False),
+                        neighbors)
+        else:
+            rsparse = np.empty(comm.size, dtype=int)
+            comm.Alltoall(ssparse, rsparse)
 
-        return ssparse, rsparse
+            topology = None
 
-    def _dist_alltoall(self, dmap=None):
+        # The graph communicator is freed as soon as it's superseded, or else
+        # once `self` gets garbage collected
+        try:
+            self._dist_topology_finalizer()
+        except AttributeError:
+            pass
+        self._dist_topology = topology
+        if topology is not None:
+            self._dist_topology_finalizer = weakref.finalize(self, free_comm,
+                                                             topology[0])
+
+        counts = (ssparse, rsparse)
+        self._dist_count_memo = (dmap, counts)
+
+        return counts
+
+    def _dist_count_sparse(self, ssparse):
         """
-        The metadata necessary to perform an ``MPI_Alltoallv`` distributing the
-        sparse data values across the MPI ranks needing them.
+        The sparse point counts that this MPI rank is expected to receive from
+        each other MPI rank, given the `ssparse` counts it sends out. Unlike a
+        dense Alltoall, the counts are only sent to the MPI ranks actually
+        receiving sparse points, via a nonblocking consensus (NBX).
         """
-        ssparse, rsparse = self._dist_count(dmap=dmap)
+        # Note: a dedicated communicator, as receiving from `MPI.ANY_SOURCE`
+        # could otherwise match any other message in flight over `self._comm`
+        comm = self._distributor._sparse_comm
+        tag = 0
+
+        sreqs = [comm.Issend(ssparse[i:i+1], dest=i, tag=tag)
+                 for i in np.flatnonzero(ssparse)]
+
+        rsparse = np.zeros(comm.size, dtype=int)
+        buf = np.empty(1, dtype=int)
+        status = MPI.Status()
+        barrier = None
+        while barrier is None or not barrier.Test():
+            if comm.Iprobe(source=MPI.ANY_SOURCE, tag=tag, status=status):
+                source = status.Get_source()
+                comm.Recv(buf, source=source, tag=tag)
+                rsparse[source] = buf[0]
+
+            # All of the counts sent out have been received, though perhaps
+            # not yet all of the counts sent to this MPI rank
+            if barrier is None and MPI.Request.Testall(sreqs):
+                barrier = comm.Ibarrier()
+
+        return rsparse
+
+    def _dist_ialltoallv(self, sendbuf, recvbuf, mpitype):
+        """
+        Start the exchange of the sparse points in `sendbuf` for those in
+        `recvbuf`, both given as ``[buffer, counts, displacements]``, with the
+        counts and displacements as computed by `_dist_alltoall`. Return the
+        nonblocking MPI request.
+
+        If the sparse points are exchanged by only a handful of MPI ranks,
+        a neighborhood collective is used in place of an ``MPI_Ialltoallv``, thus
+        sparing the per-rank overhead an ``MPI_Ialltoallv`` incurs regardless of
+        whether any data is exchanged.
+        """
+        try:
+            topology = self._dist_topology
+        except AttributeError:
+            topology = None
 
-        # Per-rank shape of send/recv data
-        sshape = []
-        rshape = []
-        for s, r in zip(ssparse, rsparse):
-            handle = list(self.shape)
-            handle[self._sparse_position] = s
-            sshape.append(tuple(handle))
+        if topology is None:
+            return self._comm.Ialltoallv([*sendbuf, mpitype], [*recvbuf, mpitype])
 
-            handle = list(self.shape)
-            handle[self._sparse_position] = r
-            rshape.append(tuple(handle))
+        comm, neighbors = topology
+        sbuf, scount, sdisp = sendbuf
+        rbuf, rcount, rdisp = recvbuf
+        return comm.Ineighbor_alltoallv(
+            [sbuf, scount[neighbors], sdisp[neighbors], mpitype],
+            [rbuf, rcount[neighbors], rdisp[neighbors], mpitype]
+        )
 
-        # Per-rank count of send/recv data
-        scount = tuple(prod(i) for i in sshape)
-        rcount = tuple(prod(i) for i in rshape)
+    def _dist_alltoall(self, dmap=None):
+        """
+        The metadata necessary to perform an ``MPI_Alltoallv`` distributing the
+        sparse data values across the MPI ranks needing them.
+        """
+        counts = self._dist_count(dmap=dmap)
+        counts0, ret = self._dist_alltoall_memo.get('data', (None, None))
+        if counts is counts0:
+            return ret
+        ssparse, rsparse = counts
+
+        # Per-rank count of send/recv data, that is the number of sparse points
+        # times the number of data values per sparse point
+        handle = list(self.shape)
+        handle[self._sparse_position] = 1
+        scount = ssparse*prod(handle)
+        rcount = rsparse*prod(handle)
 
         # Per-rank displacement of send/recv data (it's actually all contiguous,
         # but the Alltoallv needs this information anyway)
         sdisp = np.concatenate([[0], np.cumsum(scount)[:-1]])
-        rdisp = np.concatenate([[0], tuple(np.cumsum(rcount))[:-1]])
+        rdisp = np.concatenate([[0], np.cumsum(rcount)[:-1]])
 
         # Total shape of send/recv data
         sshape = list(self.shape)
-        sshape[self._sparse_position] = sum(ssparse)
+        sshape[self._sparse_position] = ssparse.sum()
         rshape = list(self.shape)
-        rshape[self._sparse_position] = sum(rsparse)
+        rshape[self._sparse_position] = rsparse.sum()
 
         # May have to swap axes, as `MPI_Alltoallv` expects contiguous data, and
         # the sparse Dimension may not be the outermost
         sshape = tuple(sshape[i] for i in self._dist_reorder_mask)
         rshape = tuple(rshape[i] for i in self._dist_reorder_mask)
 
-        return sshape, scount, sdisp, rshape, rcount, rdisp
+        ret = (sshape, scount, sdisp, rshape, rcount, rdisp)
+        self._dist_alltoall_memo['data'] = (counts, ret)
+
+        return ret
 
     def _dist_subfunc_alltoall(self, subfunc, dmap=None):
         """
         The metadata necessary to perform an ``MPI_Alltoallv`` distributing
         self's SubFunction values across the MPI ranks needing them.
         """
-        dmap = dmap or self._dist_datamap
-        ssparse, rsparse = self._dist_count(dmap=dmap)
-
-        # Per-rank shape of send/recv `coordinates`
-        shape = subfunc.shape[1:]
-        sshape = [(i, *shape) for i in ssparse]
-        rshape = [(i, *shape) for i in rsparse]
-
-        # Per-rank count of send/recv `coordinates`
-        scount = [prod(i) for i in sshape]
-        rcount = [prod(i) for i in rshape]
+        if dmap is None:
+            dmap = self._dist_datamap
+        counts = self._dist_count(dmap=dmap)
+        counts0, ret = self._dist_alltoall_memo.get(subfunc.name, (None, None))
+        if counts is counts0:
+            return ret
+        ssparse, rsparse = counts
+
+        # Per-rank count of send/recv `coordinates`, i.e. the number of sparse
+        # points times the number of values per sparse point
+        nvalues = prod(subfunc.shape[1:])
+        scount = ssparse*nvalues
+        rcount = rsparse*nvalues
 
         # Per-rank displacement of send/recv `coordinates` (it's actually all
         # contiguous, but the Alltoallv needs this information anyway)
         sdisp = np.concatenate([[0], np.cumsum(scount)[:-1]])
-        rdisp = np.concatenate([[0], tuple(np.cumsum(rcount))[:-1]])
+        rdisp = np.concatenate([[0], np.cumsum(rcount)[:-1]])
 
         # Total shape of send/recv `coordinates`
         sshape = list(subfunc.shape)
-        sshape[0] = sum(ssparse)
+        sshape[0] = ssparse.sum()
         rshape = list(subfunc.shape)
-        rshape[0] = sum(rsparse)
+        rshape[0] = rsparse.sum()
+
+        ret = (sshape, scount, sdisp, rshape, rcount, rdisp)
+        self._dist_alltoall_memo[subfunc.name] = (counts, ret)
 
-        return sshape, scount, sdisp, rshape, rcount, rdisp
+        return ret
 
-    def _dist_data_scatter(self, data=None):
+    def _dist_buffer(self, key, shape, dtype):
         """
-        A ``numpy.ndarray`` containing up-to-date data values belonging
-        to the calling MPI rank. A data value belongs to a given MPI rank R
-        if its coordinates fall within R's local domain.
+        A ``numpy.ndarray`` of given shape and dtype, to be used as a temporary
+        buffer by the MPI exchanges. The underlying memory is reused across all
+        calls with the same `key`, and only grows, geometrically, if a larger
+        buffer is requested.
+
+        Note: the received sparse data values are eventually passed on to the
+        Operator, so only the buffers which never outlive an exchange may be
+        obtained this way.
+        """
+        try:
+            buffers = self._dist_buffers
+        except AttributeError:
+            buffers = self._dist_buffers = {}
+
+        size = prod(shape)
+        buf = buffers.get(key)
+        if buf is None or buf.dtype != dtype or buf.size < size:
+            if buf is not None and buf.dtype == dtype:
+                size = max(size, int(buf.size*1.5))
+            buf = buffers[key] = np.empty(size, dtype=dtype)
+
+        return buf[:prod(shape)].reshape(shape)
+
+    def _dist_data_scatter(self, data=None, dmap=None):
+        """
+        Start the exchange of the up-to-date data values belonging to the
+        calling MPI rank. A data value belongs to a given MPI rank R if its
+        coordinates fall within R's local domain.
+
+        Return a 2-tuple consisting of the nonblocking MPI request, or None if
+        no communication is necessary, and a callable returning, once the
+        request has completed, a ``numpy.ndarray`` containing such data values.
         """
         data = data if data is not None else self.data._local
 
         # If not using MPI, don't waste time
         if self._distributor.nprocs == 1:
-            return data
+            return None, lambda: data
 
         # Compute dist map only once
-        dmap = self._dist_datamap
+        if dmap is None:
+            dmap = self._dist_datamap
         mask = self._dist_scatter_mask(dmap=dmap)
 
         # Pack sparse data values so that they can be sent out via an Alltoallv
-        data = data[mask]
-        data = np.ascontiguousarray(np.transpose(data, self._dist_reorder_mask))
+        # Note: taking from the reordered view, rather than reordering the
+        # taken data, packs the data values through a single copy. Also, unlike
+        # indexing, `np.take` sidesteps the generic advanced indexing machinery,
+        # while `mode='clip'` spares an intermediate buffer, as the indices
+        # have been validated upfront by `_dist_datamap`
+        if not self._is_reorder_identity:
+            data = np.transpose(data, self._dist_reorder_mask)
+        inds = mask[self._sparse_position]
+        buf = self._dist_buffer('data-scatter', (inds.size, *data.shape[1:]),
+                                data.dtype)
+        data = np.take(data, inds, axis=0, out=buf, mode='clip')
 
         # Send out the sparse point values
         _, scount, sdisp, rshape, rcount, rdisp = self._dist_alltoall(dmap=dmap)
         scattered = np.empty(shape=rshape, dtype=self.dtype)
-        self._comm.Alltoallv([data, scount, sdisp, self._mpitype],
-                             [scattered, rcount, rdisp, self._mpitype])
+        req = self._dist_ialltoallv([data, scount, sdisp],
+                                    [scattered, rcount, rdisp], self._mpitype)
 
         # Unpack data values so that they follow the expected storage layout
-        return np.ascontiguousarray(np.transpose(scattered, self._dist_reorder_mask))
+        # Note: `data` must be kept alive until the request has completed
+        def finalize(data=data):
+            if self._is_reorder_identity:
+                return scattered
+            return np.ascontiguousarray(np.transpose(scattered,
+                                                     self._dist_reorder_mask))
 
-    def _dist_subfunc_scatter(self, subfunc):
+        return req, finalize
+
+    def _dist_subfunc_scatter(self, subfunc, dmap=None):
+        """
+        Like `_dist_data_scatter`, but for the SubFunction `subfunc`.
+        """
         # If not using MPI, don't waste time
         if self._distributor.nprocs == 1:
-            return {subfunc: subfunc.data}
+            return None, lambda: subfunc.data
 
         # Compute dist map only once
-        dmap = self._dist_datamap
+        if dmap is None:
+            dmap = self._dist_datamap
         mask = self._dist_scatter_mask(dmap=dmap)
 
         # Pack (reordered) SubFuncion values so that they can be sent out via an Alltoallv
-        sfuncd = subfunc.data._local[mask[self._sparse_position]]
+        # Note: they're sent out in their own dtype, as any lower precision
+        # transport (e.g., half) might move a sparse point into a neighboring
+        # grid cell, see `__subfunc_setup__`
+        sfuncd = subfunc.data._local
+        inds = mask[self._sparse_position]
+        buf = self._dist_buffer('%s-scatter' % subfunc.name,
+                                (inds.size, *sfuncd.shape[1:]), sfuncd.dtype)
+        sfuncd = np.take(sfuncd, inds, axis=0, out=buf, mode='clip')
 
         # Send out the sparse point SubFuncion
         _, scount, sdisp, rshape, rcount, rdisp = \
             self._dist_subfunc_alltoall(subfunc, dmap=dmap)
         scattered = np.empty(shape=rshape, dtype=subfunc.dtype)
-        self._comm.Alltoallv([sfuncd, scount, sdisp, self._smpitype[subfunc]],
-                             [scattered, rcount, rdisp, self._smpitype[subfunc]])
-        sfuncd = scattered
-
-        # Translate global SubFuncion values into local SubFuncion values
-        if self.dist_origin[subfunc] is not None:
-            sfuncd = sfuncd - np.array(self.dist_origin[subfunc], dtype=subfunc.dtype)
-        return {subfunc: sfuncd}
+        req = self._dist_ialltoallv([sfuncd, scount, sdisp],
+                                    [scattered, rcount, rdisp],
+                                    self._smpitype[subfunc])
+
+        # Translate global SubFuncion values into local SubFuncion values, in
+        # place as `scattered` is a temporary buffer anyway
+        # Note: `sfuncd` must be kept alive until the request has completed
+        def finalize(sfuncd=sfuncd):
+            offset = self._dist_origin_offsets[subfunc]
+            if offset is not None:
+                np.subtract(scattered, offset, out=scattered)
+            return scattered
+
+        return req, finalize
+
+    def _dist_data_gather(self, data, dmap=None):
+        """
+        Start the exchange of the sparse data values computed by the calling
+        MPI rank back to the MPI ranks physically owning them.
 
-    def _dist_data_gather(self, data):
+        Return a 2-tuple consisting of the nonblocking MPI request, or None if
+        no communication is necessary, and a callable updating ``self.data``
+        once the request has completed.
+        """
         # If not using MPI, don't waste time
         if self._distributor.nprocs == 1:
-            return
+            return None, lambda: None
 
         # Compute dist map only once
         try:
             data = self._C_as_ndarray(data)
         except AttributeError:
             pass
-        dmap = self._dist_datamap
-        mask = self._dist_scatter_mask(dmap=dmap)
+        if dmap is None:
+            dmap = self._dist_datamap
+        mask = self._dist_gather_mask(dmap=dmap)
 
         # Pack sparse data values so that they can be sent out via an Alltoallv
-        data = np.ascontiguousarray(np.transpose(data, self._dist_reorder_mask))
+        if self._is_reorder_identity:
+            data = np.ascontiguousarray(data)
+        else:
+            data = np.ascontiguousarray(np.transpose(data, self._dist_reorder_mask))
 
         # Send back the sparse point values
         sshape, scount, sdisp, rshape, rcount, rdisp = self._dist_alltoall(dmap=dmap)
-        gathered = np.empty(shape=sshape, dtype=self.dtype)
+        gathered = self._dist_buffer('data-gather', sshape, self.dtype)
 
-        self._comm.Alltoallv([data, rcount, rdisp, self._mpitype],
-                             [gathered, scount, sdisp, self._mpitype])
+        req = self._dist_ialltoallv([data, rcount, rdisp],
+                                    [gathered, scount, sdisp], self._mpitype)
 
         # Unpack data values so that they follow the expected storage layout
-        gathered = np.ascontiguousarray(np.transpose(gathered, self._dist_reorder_mask))
-        self._data[mask] = gathered[:]
+        # Note: no need for a contiguous copy, as it's written straight into
+        # `self._data` anyway
+        def finalize(data=data):
+            if self._is_reorder_identity:
+                self._data[mask] = gathered
+            else:
+                self._data[mask] = np.transpose(gathered, self._dist_reorder_mask)
+
+        return req, finalize
+
+    def _dist_subfunc_gather(self, sfuncd, subfunc, dmap=None):
+        """
+        Like `_dist_data_gather`, but for the SubFunction `subfunc`.
+        """
+        # If not using MPI, don't waste time -- not even on the conversion
+        # of `sfuncd` or on the gather mask
+        if self._distributor.nprocs == 1:
+            return None, lambda: None
 
-    def _dist_subfunc_gather(self, sfuncd, subfunc):
         try:
             sfuncd = subfunc._C_as_ndarray(sfuncd)
         except AttributeError:
             pass
-        # If not using MPI, don't waste time
-        if self._distributor.nprocs == 1:
-            return
 
         # Compute dist map only once
-        dmap = self._dist_datamap
-        mask = self._dist_scatter_mask(dmap=dmap)
+        if dmap is None:
+            dmap = self._dist_datamap
+        mask = self._dist_gather_mask(dmap=dmap)
 
-        # Pack (reordered) SubFuncion values so that they can be sent out via an Alltoallv
-        if self.dist_origin[subfunc] is not None:
-            sfuncd = sfuncd + np.array(self.dist_origin[subfunc], dtype=subfunc.dtype)
+        # Translate local SubFuncion values back into global SubFuncion values,
+        # in place as `sfuncd` is the temporary buffer produced by
+        # `_dist_subfunc_scatter` anyway
+        offset = self._dist_origin_offsets[subfunc]
+        if offset is not None:
+            np.add(sfuncd, offset, out=sfuncd)
 
         # Send out the sparse point SubFuncion values
         sshape, scount, sdisp, _, rcount, rdisp = \
             self._dist_subfunc_alltoall(subfunc, dmap=dmap)
-        gathered = np.empty(shape=sshape, dtype=subfunc.dtype)
-        self._comm.Alltoallv([sfuncd, rcount, rdisp, self._smpitype[subfunc]],
-                             [gathered, scount, sdisp, self._smpitype[subfunc]])
-        subfunc.data._local[mask[self._sparse_position]] = gathered[:]
+        gathered = self._dist_buffer('%s-gather' % subfunc.name, sshape,
+                                     subfunc.dtype)
+        req = self._dist_ialltoallv([sfuncd, rcount, rdisp],
+                                    [gathered, scount, sdisp],
+                                    self._smpitype[subfunc])
+
+        def finalize(sfuncd=sfuncd):
+            subfunc.data._local[mask[self._sparse_position]] = gathered
 
         # Note: this method "mirrors" `_dist_scatter`: a sparse point that is sent
         # in `_dist_scatter` is here received; a sparse point that is received in
         # `_dist_scatter` is here sent.
 
+        return req, finalize
+
     def _dist_scatter(self, data=None):
-        mapper = {self: self._dist_data_scatter(data=data)}
+        # If not using MPI, don't waste time
+        if self._distributor.nprocs == 1:
+            mapper = {self: data if data is not None else self.data._local}
+            for i in self._sub_functions:
+                subfunc = getattr(self, i)
+                if subfunc is not None:
+                    mapper[subfunc] = subfunc.data
+            return mapper
+
+        # The data distribution map is shared by all of the exchanges, so it's
+        # computed only once
+        # Note: the exchanges always operate on host memory, as they take place
+        # while the Operator arguments are being prepared, that is before the
+        # Operator itself transfers the scattered values to the device, if any
+        dmap = self._dist_datamap
+
+        handles = {self: self._dist_data_scatter(data=data, dmap=dmap)}
         for i in self._sub_functions:
-            if getattr(self, i) is not None:
-                mapper.update(self._dist_subfunc_scatter(getattr(self, i)))
-        return mapper
+            subfunc = getattr(self, i)
+            if subfunc is not None:
+                handles[subfunc] = self._dist_subfunc_scatter(subfunc, dmap=dmap)
+
+        # The data and SubFunction exchanges are independent, hence they're all
+        # in flight at once
+        self._dist_waitall(handles.values())
+
+        return {k: finalize() for k, (_, finalize) in handles.items()}
 
     def _dist_gather(self, data, *subfunc):
-        self._dist_data_gather(data)
+        # If not using MPI, don't waste time
+        if self._distributor.nprocs == 1:
+            return
+
+        # The data distribution map is shared by all of the exchanges, so it's
+        # computed only once
+        dmap = self._dist_datamap
+
+        handles = [self._dist_data_gather(data, dmap=dmap)]
         for (sg, s) in zip(subfunc, self._sub_functions):
             if getattr(self, s) is not None:
-                self._dist_subfunc_gather(sg, getattr(self, s))
+                handles.append(self._dist_subfunc_gather(sg, getattr(self, s),
+                                                         dmap=dmap))
+
+        # The data and SubFunction exchanges are independent, hence they're all
+        # in flight at once
+        self._dist_waitall(handles)
+
+        for _, finalize in handles:
+            finalize()
+
+    @classmethod
+    def _dist_waitall(cls, handles):
+        reqs = [req for req, _ in handles if req is not None]
+        if reqs:
+            MPI.Request.Waitall(reqs)
 
     def _eval_at(self, func):
         return self
@@ -1224,7 +1683,9 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
     matrix: scipy.sparse matrix
         A scipy-style sparse matrix with a row for each physical
         point in the grid, and a column for each index into the
-        data array.
+        data array. Ideally in COO format, with int32 indices and
+        values of the same dtype as the MatrixSparseTimeFunction,
+        as this spares a conversion when the matrix is unpacked.
 
     r: int or Mapping[Dimension, Optional[int]]
         The number of gridpoints in each Dimension used to inject/interpolate
@@ -1297,6 +1758,12 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
     _time_position = 0
     """Position of time index among the function indices."""
 
+    _interpolate_unroll = 8
+    """
+    Maximum number of grid points per location for the loops over the radius
+    Dimensions to be unrolled in `interpolate`.
+    """
+
     # We use DiscreteFunction instead of AbstractSparseTimeFunction
     # because we want to get rid of 'npoint'
     __rkwargs__ = (DiscreteFunction.__rkwargs__ +
@@ -1362,7 +1829,12 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
             space_order=0, parent=self)
 
         # There is a coefficient array per grid Dimension
-        # I could pack these into one array but that seems less readable?
+        # Note: these are not packed into a single `(nloc, ndim, r)` array, as
+        # the radius may differ across the grid Dimensions, and the coefficients
+        # along a non-local Dimension (i.e., radius None) span the whole grid
+        # Dimension. Besides, it's the innermost loop over the radius Dimension
+        # that reads the coefficients, so they're accessed with unit stride
+        # within each array anyway
         self.interpolation_coefficients = {}
         self.interpolation_coefficients_t_bogus = {}
         self.rdims = []
@@ -1401,10 +1873,15 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
         self.nnzdim = Dimension('nnz_%s' % self.name)
 
         # In the non-MPI case, at least, we should fill these in once
+        # Note: if `matrix` is already in COO format, `tocoo(copy=False)` simply
+        # returns it, without any conversion or validation
         if self._distributor.nprocs == 1:
             m_coo = self.matrix.tocoo(copy=False)
             nnz_size = m_coo.nnz
         else:
+            # Just a placeholder. Note that no memory is allocated for it, as
+            # the SubFunctions' data is only allocated upon first access, while
+            # with MPI the actual arrays are provided by `manual_scatter`
             nnz_size = 1
 
         self._mrow = DynamicSubFunction(
@@ -1437,21 +1914,11 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
 
         # This loop maintains a map of nnz indices which touch each
         # coordinate of the parallised injection Dimension
-        # This takes the form of a list of nnz indices, and a start/end
-        # position in that list for each index in the parallel dim
+        # The nonzeros are sorted along the parallel dim, so this takes the
+        # form of a start/end position in the nonzeros for each index in the
+        # parallel dim
         self.par_dim_to_nnz_dim = DynamicDimension('par_dim_to_nnz_%s' % self.name)
 
-        # This map acts as an indirect sort of the sources according to their
-        # position along the parallelisation dimension
-        self._par_dim_to_nnz_map = DynamicSubFunction(
-            name='par_dim_to_nnz_map_%s' % self.name,
-            dtype=np.int32,
-            dimensions=(self.par_dim_to_nnz_dim,),
-            # shape is unknown at this stage
-            shape=(1,),
-            space_order=0,
-            parent=self,
-        )
         self._par_dim_to_nnz_m = DynamicSubFunction(
             name='par_dim_to_nnz_m_%s' % self.name,
             dtype=np.int32,
@@ -1471,10 +1938,17 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
             parent=self,
         )
 
+        # Note: the COO triplets are deliberately kept in three distinct
+        # SubFunctions rather than in a single joint allocation. The generated
+        # code accesses them through three independent (and sequential) streams
+        # anyway, while with MPI they are rebuilt by each `manual_scatter`, with
+        # a different number of nonzeros on each MPI rank
+        # Note: `copyto` bypasses the indexing machinery of `Data`, while
+        # reducing to a plain copy if the dtypes match
         if self._distributor.nprocs == 1:
-            self._mrow.data[:] = m_coo.row
-            self._mcol.data[:] = m_coo.col
-            self._mval.data[:] = m_coo.data
+            np.copyto(self._mrow.data._local, m_coo.row, casting='same_kind')
+            np.copyto(self._mcol.data._local, m_coo.col, casting='same_kind')
+            np.copyto(self._mval.data._local, m_coo.data, casting='same_kind')
 
         # self._fd = generate_fd_shortcuts(self)
 
@@ -1522,10 +1996,6 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
     def mval(self):
         return self._mval
 
-    @property
-    def par_dim_to_nnz_map(self):
-        return self._par_dim_to_nnz_map
-
     @property
     def par_dim_to_nnz_m(self):
         return self._par_dim_to_nnz_m
@@ -1534,12 +2004,25 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
     def par_dim_to_nnz_M(self):
         return self._par_dim_to_nnz_M
 
+    @cached_property
+    def _coefficients_indexed(self):
+        """
+        The ``(IndexedData, radius Dimension)`` pairs of the interpolation
+        coefficients, one per grid Dimension, shared by `interpolate` and
+        `inject`.
+        """
+        ret = []
+        for d in self.grid.dimensions:
+            f = self.interpolation_coefficients[d]
+            _, rd = f.dimensions
+            ret.append((f.indexed, rd))
+        return tuple(ret)
+
     @property
     def _sub_functions(self):
         return ('gridpoints',
                 *['coefficients_%s' % d.name for d in self.grid.dimensions],
-                'mrow', 'mcol', 'mval', 'par_dim_to_nnz_map',
-                'par_dim_to_nnz_m', 'par_dim_to_nnz_M')
+                'mrow', 'mcol', 'mval', 'par_dim_to_nnz_m', 'par_dim_to_nnz_M')
 
     def interpolate(self, expr, u_t=None, p_t=None):
         """Creates a :class:`sympy.Eq` equation for the interpolation
@@ -1557,7 +2040,7 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
         if u_t is not None:
             time = self.grid.time_dim
             t = self.grid.stepping_dim
-            expr = expr.subs(t, u_t).subs(time, u_t)
+            expr = expr.xreplace({t: u_t, time: u_t})
 
         gridpoints = self._gridpoints.indexed
         mrow = self._mrow.indexed
@@ -1569,16 +2052,17 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
 
         row = mrow[nnzdim]
 
-        dim_subs = [(pdim, mcol[nnzdim])]
+        dim_subs = {pdim: mcol[nnzdim]}
         coeffs = [mval[nnzdim]]
-        for i, d in enumerate(self.grid.dimensions):
-            _, rd = self.interpolation_coefficients[d].dimensions
-            coefficients = self.interpolation_coefficients[d].indexed
+        radii = {}
+        for i, (d, (coefficients, rd)) in enumerate(zip(self.grid.dimensions,
+                                                        self._coefficients_indexed)):
 
             # If radius is set to None, then the coefficient array is
             # actually the full size of the grid Dimension itself
             if self._radius[d] is not None:
-                dim_subs.append((d, rd + gridpoints[row, i]))
+                dim_subs[d] = rd + gridpoints[row, i]
+                radii[rd] = self._radius[d]
             else:
                 assert d is rd
 
@@ -1587,7 +2071,17 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
         # Apply optional time symbol substitutions to lhs of assignment
         lhs = self if p_t is None else self.subs(tdim, p_t)
         lhs = lhs.subs([(pdim, mcol[nnzdim])])
-        rhs = prod(coeffs) * expr.subs(dim_subs)
+        # Note: `expr` is indexified, hence a plain `xreplace` suffices, which,
+        # unlike `subs`, performs all of the substitutions in a single pass
+        rhs = prod(coeffs) * expr.xreplace(dim_subs)
+
+        # The radii are known at this point, so if there are only a few grid
+        # points per location, the loops over the radius Dimensions are fully
+        # unrolled, thus turning the interpolation of each nonzero into a
+        # straight-line sequence of multiply-adds
+        if radii and prod(radii.values()) <= self._interpolate_unroll:
+            rhs = sympy.Add(*[rhs.xreplace(dict(zip(radii, i)))
+                              for i in product(*[range(r) for r in radii.values()])])
 
         return [Eq(self, 0), Inc(lhs, rhs)]
 
@@ -1608,19 +2102,21 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
 
         # Apply optional time symbol substitutions to field and expr
         if u_t is not None:
-            field = field.subs(field.indices[0], u_t)
+            field = field.xreplace({field.indices[0]: u_t})
         if p_t is not None:
-            expr = expr.subs(tdim, p_t)
+            expr = expr.xreplace({tdim: p_t})
 
         gridpoints = self._gridpoints.indexed
         mrow = self._mrow.indexed
         mcol = self._mcol.indexed
         mval = self._mval.indexed
-        partonnz = self._par_dim_to_nnz_map.indexed
 
-        nnz_index = partonnz[par_dim_to_nnz_dim]
+        # The nonzeros are sorted by their coordinate along the parallel
+        # Dimension (see `_build_par_dim_to_nnz`), so they're accessed directly
+        # rather than through an indirection map
+        nnz_index = par_dim_to_nnz_dim
         row = mrow[nnz_index]
-        dim_subs = [(pdim, mcol[nnz_index])]
+        dim_subs = {pdim: mcol[nnz_index]}
         coeffs = [mval[nnz_index]]
 
         # Devito requires a fixed ordering of Dimensions across
@@ -1634,9 +2130,8 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
         implicit_dims_for_range = [tdim]
         implicit_dims_for_inject = [tdim]
 
-        for i, d in enumerate(self.grid.dimensions):
-            _, rd = self.interpolation_coefficients[d].dimensions
-            coefficients = self.interpolation_coefficients[d].indexed
+        for i, (d, (coefficients, rd)) in enumerate(zip(self.grid.dimensions,
+                                                        self._coefficients_indexed)):
 
             # There are four cases here.
             if d is self._par_dim:
@@ -1670,7 +2165,7 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
                     # local. In this case the loop is over the radius Dimension
                     # and we need to substitute d with the offset from the
                     # grid point
-                    dim_subs.append((d, rd + gridpoints[row, i]))
+                    dim_subs[d] = rd + gridpoints[row, i]
                     coeffs.append(coefficients[row, rd])
                     loop_dim = rd
 
@@ -1678,8 +2173,10 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
                 if not par_dim_seen:
                     implicit_dims_for_range.append(loop_dim)
 
-        rhs = prod(coeffs) * expr
-        field = field.subs(dim_subs)
+        # Note: both `field` and `expr` are indexified, hence a plain `xreplace`
+        # suffices, see `interpolate`
+        rhs = (prod(coeffs) * expr).xreplace(dim_subs)
+        field = field.xreplace(dim_subs)
         out = [
             Eq(
                 par_dim_to_nnz_dim.symbolic_min,
@@ -1693,13 +2190,21 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
             ),
             Inc(
                 field,
-                rhs.subs(dim_subs),
+                rhs,
                 implicit_dims=IgnoreDimSort(implicit_dims_for_inject),
             ),
         ]
 
         return out
 
+    def reorder_by_locality(self):
+        # The locations are mapped onto the sources/receivers by `matrix`, so
+        # neither the data, which has one entry per matrix column, nor the
+        # SubFunctions, which have one entry per location or per nonzero, are
+        # laid out along the sparse points as assumed by the parent class
+        raise NotImplementedError("MatrixSparseTimeFunction does not support "
+                                  "`reorder_by_locality`")
+
     @classmethod
     def __shape_setup__(cls, **kwargs):
         # This happens before __init__, so we have to get 'npoint'
@@ -1768,8 +2273,8 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
 
             # Define the split
             dim_breaks[:-2:2] = [
-                decomp_part[0] - self.r + 1 for decomp_part in decomp]
-            dim_breaks[-2] = decomp[-1][-1] + 1 - self.r + 1
+                decomp_part[0] - dim_r + 1 for decomp_part in decomp]
+            dim_breaks[-2] = decomp[-1][-1] + 1 - dim_r + 1
             dim_breaks[1:-1:2] = [
                 decomp_part[0] for decomp_part in decomp]
             dim_breaks[-1] = decomp[-1][-1] + 1
@@ -1780,76 +2285,89 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
             if self.r[dim] is None:
                 gridpoints_dim = np.zeros_like(gridpoints_dim)
 
-            try:
-                binned_gridpoints[:, idim] = np.digitize(
-                    gridpoints_dim, dim_breaks)
-            except ValueError as e:
+            # The breaks are sorted unless some ranks are too skinny, in which
+            # case the groups would overlap. Otherwise, a plain binary search
+            # does the binning, without `np.digitize`'s own monotonicity checks
+            if np.any(np.diff(dim_breaks) < 0):
                 raise ValueError(
-                    "decomposition failed!  Are some ranks too skinny?"
-                ) from e
-
-            this_group_rank_map = {
-                0: {None},
-                1: {None, 0},
-                **{2*i+2: {i} for i in range(decomp_size)},
-                **{2*i+2+1: {i, i+1} for i in range(decomp_size-1)},
-                2*decomp_size+1: {decomp_size-1, None},
-                2*decomp_size+2: {None}}
+                    "decomposition failed!  Are some ranks too skinny?")
+            binned_gridpoints[:, idim] = np.searchsorted(
+                dim_breaks, gridpoints_dim, side='right')
+
+            # The (at most two) Dimension-specific ranks of each group, with
+            # -1 standing for the "bad" ranks -1 and decomp_size, and -2 for
+            # the unused slot of the groups contributing to a single rank
+            this_group_rank_map = np.full((2*decomp_size+3, 2), -2, dtype=np.int32)
+            this_group_rank_map[[0, -1], 0] = -1
+            this_group_rank_map[1] = [-1, 0]
+            this_group_rank_map[2:-2:2, 0] = range(decomp_size)
+            this_group_rank_map[3:-3:2, 0] = range(decomp_size-1)
+            this_group_rank_map[3:-3:2, 1] = range(1, decomp_size)
+            this_group_rank_map[-2] = [decomp_size-1, -1]
 
             dim_group_dim_rank.append(this_group_rank_map)
 
         # This allows the points to be grouped into non-overlapping sets
         # based on their bin in each Dimension.  For each set we build a list
-        # of points.
-        bins, inverse, counts = np.unique(
-            binned_gridpoints,
-            return_inverse=True,
-            return_counts=True,
-            axis=0)
-
-        # inverse is now a "unique bin number" for each point gridpoints
-        # we want to turn that into a list of points for each bin
-        # so we argsort
-        inverse_argsort = np.argsort(inverse).astype(np.int32)
-        cumulative_counts = np.cumsum(counts)
-        gp_map = {tuple(bi): inverse_argsort[cci-ci:cci]
-                  for bi, cci, ci in zip(bins, cumulative_counts, counts)
-                  }
+        # of points. Sorting the points lexicographically by bin makes each
+        # set a contiguous run, so a single sort is all that's needed. The
+        # per-dimension groups are packed into a single (row-major) integer key,
+        # so that the sort is over scalars rather than rows; the keys being
+        # small, this is typically a radix sort
+        ngroups = tuple(len(dgdr) for dgdr in dim_group_dim_rank)
+        keys = np.ravel_multi_index(tuple(np.asarray(binned_gridpoints).T), ngroups)
+        keys = keys.astype(np.min_scalar_type(prod(ngroups)))
+        order = np.argsort(keys, kind='stable').astype(np.int32)
+        keys = keys[order]
+        first = np.ones(order.size, dtype=bool)
+        first[1:] = keys[1:] != keys[:-1]
+        bins = np.stack(np.unravel_index(keys[first], ngroups), axis=1)
+
+        # the points in the i-th bin are
+        # order[bin_starts[i]:bin_starts[i] + bin_sizes[i]]
+        bin_starts = np.flatnonzero(first)
+        bin_sizes = np.diff(np.append(bin_starts, order.size))
 
         # the result is now going to be a concatenation of these lists
         # for each of the output ranks
         # each bin has a set of ranks -> each rank has a set (possibly empty)
         # of bins
 
-        # For each rank get the per-dimension coordinates
-        # TODO maybe we should cache this on the distributor
-        dim_ranks_to_glb = {
-            tuple(distributor.comm.Get_coords(rank)): rank
-            for rank in range(distributor.comm.Get_size())}
-
-        global_rank_to_bins = {}
-
-        from itertools import product
-        for bi in bins:
-            # This is a list of sets for the Dimension-specific rank
-            dim_rank_sets = [dgdr[bii]
-                             for dgdr, bii in zip(dim_group_dim_rank, bi)]
-
-            # Convert these to an absolute rank
-            # This is where we will throw a KeyError if there are points OOB
-            for dim_ranks in product(*dim_rank_sets):
-                global_rank = dim_ranks_to_glb[tuple(dim_ranks)]
-                global_rank_to_bins\
-                    .setdefault(global_rank, set())\
-                    .add(tuple(bi))
-
-        empty = np.array([], dtype=np.int32)
-
-        return [np.concatenate((
-            empty, *[gp_map[bi] for bi in global_rank_to_bins.get(rank, [])]))
-            for rank in range(distributor.comm.Get_size())]
-
-    def _build_par_dim_to_nnz(self, active_gp, active_mrow):
+        # All of the (at most 2**ndim) combinations of the Dimension-specific
+        # ranks of each bin, as a (nbins, 2**ndim, ndim) array
+        ndim = len(ngroups)
+        branches = np.array(list(product((0, 1), repeat=ndim)), dtype=np.int32)
+        dim_ranks = np.stack([
+            dgdr[bins[:, idim]][:, branches[:, idim]]
+            for idim, dgdr in enumerate(dim_group_dim_rank)], axis=-1)
+
+        valid = np.all(dim_ranks != -2, axis=-1)
+        bin_ids = np.nonzero(valid)[0]
+        dim_ranks = dim_ranks[valid]
+        if np.any(dim_ranks == -1):
+            raise ValueError("Some points lie outside of the domain")
+
+        # Convert these to an absolute rank, and bucket the bins by rank. The
+        # ranks of a Cartesian communicator are in row-major order of the
+        # per-dimension coordinates, so no rank lookups are needed at all
+        global_ranks = np.ravel_multi_index(tuple(dim_ranks.T), distributor.topology)
+        rank_order = np.argsort(global_ranks, kind='stable')
+        bin_ids = bin_ids[rank_order]
+        rank_edges = np.searchsorted(global_ranks[rank_order],
+                                     np.arange(distributor.nprocs + 1))
+
+        # Rather than concatenating the lists of points of each rank's bins, all
+        # of them are gathered at once into a single output buffer, which is
+        # then split by rank
+        sizes = bin_sizes[bin_ids]
+        offsets = np.concatenate(([0], np.cumsum(sizes)))
+        positions = np.repeat(bin_starts[bin_ids] - offsets[:-1], sizes)
+        positions += np.arange(offsets[-1])
+
+        return np.split(order[positions], offsets[rank_edges[1:-1]])
+
+    def _build_par_dim_to_nnz(self, active_gp, active_mrow, active_mcol,
+                              active_mval):
         # The case where we parallelise over a non-local index is suboptimal, but
         # supported. In this case, the actual grid point locations are ignored
         # and all points are touched.
@@ -1861,7 +2379,9 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
             # values touch all parts of the array
             nnz_M = active_mrow.size - 1
             return {
-                self._par_dim_to_nnz_map: np.arange(active_mrow.size, dtype=np.int32),
+                self.mrow: active_mrow,
+                self.mcol: active_mcol,
+                self.mval: active_mval,
                 self._par_dim_to_nnz_m: np.zeros(
                     (self.grid.shape_local[pardim_index],), dtype=np.int32
                 ),
@@ -1874,38 +2394,94 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
         r = self._radius[self._par_dim]
 
         # now, the parameters can be devito.Data, which doesn't like fancy indexing
-        # very much. So, we convert to regular numpy arrays
-        active_gp = np.array(active_gp)
-        active_mrow = np.array(active_mrow)
-
-        # sort the injected nonzero indices by parallel coordinate
+        # very much. So, we view them as regular numpy arrays (no copies)
+        active_gp = np.asarray(active_gp)
+        active_mrow = np.asarray(active_mrow)
+
+        # sort the injected nonzero indices by parallel coordinate. The nonzeros
+        # themselves are reordered, rather than accessed through the reordering,
+        # so that the injection streams through them sequentially. Also, the
+        # sort is stable so that the nonzeros touching the same coordinate keep
+        # their relative order
         pardim_coordinates_nnz = active_gp[active_mrow, pardim_index]
-        reordering = np.argsort(pardim_coordinates_nnz)
-        pardim_reordered = pardim_coordinates_nnz[reordering]
+
+        # we don't worry about MPI here; by the time this function is called,
+        # all gridpoints have been renumbered to local offsets. Note that the
+        # gridpoints may still lie to the left of the local domain, as long as
+        # the injection stencil reaches into it
+        nx = self.grid.shape_local[pardim_index]
+        lower = min(pardim_coordinates_nnz.min(initial=0), 0)
+        upper = max(pardim_coordinates_nnz.max(initial=0) + 1, nx)
+
+        # The gridpoints span a small range, so they're sorted as the narrowest
+        # unsigned keys fitting such a range. For keys of up to 16 bits, the
+        # stable sort is a radix sort, that is linear in nnz. The keys are
+        # written straight in their final type, without intermediate copies
+        keys = np.empty_like(pardim_coordinates_nnz,
+                             dtype=np.min_scalar_type(upper - lower))
+        np.subtract(pardim_coordinates_nnz, lower, out=keys, casting='unsafe')
+        reordering = np.argsort(keys, kind='stable')
 
         # now each x coordinate that we inject into has a range
         # of relevant entries in the reordered array
 
-        # we don't worry about MPI here; by the time this function is called,
-        # all gridpoints have been renumbered to local offsets
+        # The ranges come straight from the cumulative count of the nonzeros
+        # per coordinate, in a single pass over the nonzeros and the coordinates,
+        # rather than through a binary search per coordinate. They're int32 from
+        # the get-go, so that no final casts are needed.
+        # cumulative[i] is the number of nonzeros with gridpoint < lower + i
+        counts = np.bincount(keys, minlength=upper - lower)
+        cumulative = np.zeros(upper - lower + 1, dtype=np.int32)
+        np.cumsum(counts, out=cumulative[1:])
 
         # this coordinate is touched by any source with gridpoint >= x - r + 1
         # and gridpoint <= x
-        all_xs = np.arange(self.grid.shape_local[pardim_index])
+        all_xs = np.arange(nx) - lower
 
         # This should satisfy:
         # x_reordered[i-1] < x - r + 1 <= x_reordered[i]
-        reordered_m = np.searchsorted(pardim_reordered, all_xs - r + 1, side='left')
+        reordered_m = cumulative[np.maximum(all_xs - r + 1, 0)]
         # x_reordered[i-1] <= x < x_reordered[i]
-        reordered_M = np.searchsorted(pardim_reordered, all_xs, side='right') - 1
+        reordered_M = cumulative[all_xs + 1] - 1
 
         # return output suitable for scatter
         return {
-            self._par_dim_to_nnz_map: reordering.astype(np.int32),
-            self._par_dim_to_nnz_m: reordered_m.astype(np.int32),
-            self._par_dim_to_nnz_M: reordered_M.astype(np.int32),
+            self.mrow: active_mrow[reordering],
+            self.mcol: np.asarray(active_mcol)[reordering],
+            self.mval: np.asarray(active_mval)[reordering],
+            self._par_dim_to_nnz_m: reordered_m,
+            self._par_dim_to_nnz_M: reordered_M,
         }
 
+    def _fill_coo(self, mrow, mcol, mval):
+        """
+        Write the COO triplets of `self.matrix` into `mrow`, `mcol` and `mval`.
+
+        A CSR matrix is written out straight from its own arrays, in the same
+        order as `tocoo` would, but without the intermediate COO arrays.
+        """
+        matrix = self.matrix
+        if matrix.format == 'csr':
+            nnz = matrix.nnz
+            mrow[:] = np.repeat(np.arange(matrix.shape[0], dtype=np.int32),
+                                np.diff(matrix.indptr))
+            mcol[:] = matrix.indices[:nnz]
+            mval[:] = matrix.data[:nnz]
+        else:
+            m_coo = matrix.tocoo(copy=False)
+            mrow[:] = m_coo.row
+            mcol[:] = m_coo.col
+            mval[:] = m_coo.data
+
+    @classmethod
+    def _unpack(cls, buf, shapes):
+        """
+        Split the flat buffer `buf` into views of the given shapes.
+        """
+        sizes = [prod(i) for i in shapes]
+        return [v.reshape(i) for v, i in
+                zip(np.split(buf, np.cumsum(sizes)[:-1]), shapes)]
+
     def manual_scatter(self, *, data_all_zero=False):
         distributor = self._distributor
 
@@ -1916,16 +2492,11 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
                 **{
                     getattr(self, k): getattr(self, k).data for k in self._sub_functions
                 },
-                self.mrow: self.mrow.data,
-                self.mcol: self.mcol.data,
-                self.mval: self.mval.data,
-                **self._build_par_dim_to_nnz(self.gridpoints.data, self.mrow.data),
+                **self._build_par_dim_to_nnz(self.gridpoints.data, self.mrow.data,
+                                             self.mcol.data, self.mval.data),
             }
             return
 
-        # Generate the matrix arrays
-        m_coo = self.matrix.tocoo(copy=False)
-
         # HACK: for now, only take npoints != 0 on rank 0
         # Broadcast all the data, gridpoints, coefficients to all ranks
         # Each rank then ignores any of the data which isn't in its own
@@ -1947,7 +2518,7 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
         npoint, nloc, nnz, ndim, r_tuple_bcast, nt = distributor.comm.bcast(
             (self.npoint,
              self._gridpoints.data.shape[0],
-             m_coo.nnz,
+             self.matrix.nnz,
              self._gridpoints.data.shape[-1],
              r_tuple,
              self.data.shape[self._time_position]), root=0)
@@ -1962,37 +2533,36 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
             for ri, d in zip(r_tuple, self.grid.dimensions)
         )
 
-        # now all ranks can allocate the buffers to receive into
+        # now all ranks can allocate the buffers to receive into. The integer
+        # and the floating point arrays are packed into one buffer each, so
+        # that they're all broadcast through two collectives, rather than one
+        # per array
+        int_shapes = [(nloc, ndim), (nnz,), (nnz,)]
+        float_shapes = [(nloc, ri) for ri in r_tuple_no_none] + [(nnz,)]
+        int_buf = np.empty(sum(prod(i) for i in int_shapes), dtype=np.int32)
+        float_buf = np.empty(sum(prod(i) for i in float_shapes), dtype=self.dtype)
+        scattered_gp, scattered_mrow, scattered_mcol = self._unpack(
+            int_buf, int_shapes)
+        *scattered_coeffs, scattered_mval = self._unpack(float_buf, float_shapes)
+
         if distributor.myrank != 0:
             if data_all_zero:
                 scattered_data = np.zeros([nt, npoint], dtype=self.dtype)
             else:
                 scattered_data = np.empty([nt, npoint], dtype=self.dtype)
-            scattered_gp = np.empty([nloc, ndim], dtype=np.int32)
-            scattered_coeffs = [
-                np.empty([nloc, r_tuple_no_none[idim]], dtype=self.dtype)
-                for idim in range(ndim)
-            ]
-            scattered_mrow = np.empty([nnz], dtype=np.int32)
-            scattered_mcol = np.empty([nnz], dtype=np.int32)
-            scattered_mval = np.empty([nnz], dtype=self.dtype)
         else:
             scattered_data = self.data
 
             # These are copies because we mess with them down below
-            scattered_gp = self._gridpoints.data.copy()
-            scattered_coeffs = [
-                self.interpolation_coefficients[d].data.copy()
-                for d in self.grid.dimensions]
-            scattered_mrow = m_coo.row.copy()
-            scattered_mcol = m_coo.col.copy()
-            scattered_mval = m_coo.data.copy()
+            scattered_gp[:] = self._gridpoints.data
+            for idim, d in enumerate(self.grid.dimensions):
+                scattered_coeffs[idim][:] = self.interpolation_coefficients[d].data
+            self._fill_coo(scattered_mrow, scattered_mcol, scattered_mval)
 
         if not data_all_zero:
             distributor.comm.Bcast(scattered_data, root=0)
-        for arr in [scattered_gp, *scattered_coeffs,
-                    scattered_mrow, scattered_mcol, scattered_mval]:
-            distributor.comm.Bcast(arr, root=0)
+        distributor.comm.Bcast(int_buf, root=0)
+        distributor.comm.Bcast(float_buf, root=0)
 
         # now recreate the matrix to only contain points in our
         # local domain.
@@ -2003,60 +2573,55 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
         #  3 - in the domain, but the injection stencil includes points
         #      to the right
         #  4 - completely to the right
-        active_mrow = scattered_mrow
-        active_mcol = scattered_mcol
-        active_mval = scattered_mval
-
-        # first, build a reduced matrix excluding any points outside our domain
-        for idim, (dim, mycoord) in enumerate(zip(
-                self.grid.dimensions, distributor.mycoords)):
-            _left = distributor.decomposition[idim][mycoord][0]
-            _right = distributor.decomposition[idim][mycoord][-1] + 1
 
-            this_dim_r = self.r[dim]
-            effective_gridpoints = scattered_gp[active_mrow, idim]
-            if this_dim_r is None:
-                this_dim_r = self.grid.dimension_map[dim].glb
-                effective_gridpoints = np.zeros_like(effective_gridpoints)
+        # the bounds of our domain along each Dimension, looked up only once
+        local_bounds = [(decomp[c][0], decomp[c][-1] + 1) for decomp, c
+                        in zip(distributor.decomposition, distributor.mycoords)]
+
+        # first, build a reduced matrix excluding any points outside our domain.
+        # The checks along all Dimensions are fused into a single mask, so that
+        # the matrix is only compacted once
+        gp_rows = scattered_gp[scattered_mrow]
+        mask = np.ones(nnz, dtype=bool)
+        for idim, (dim, (_left, _right)) in enumerate(zip(
+                self.grid.dimensions, local_bounds)):
+            # all points touch the broadcasted Dimensions
+            if self.r[dim] is None:
+                continue
 
             # rewrite the matrix to remove the rows in groups 0 and 4
-            mask = (
-                (effective_gridpoints >= _left - this_dim_r + 1)
-                & (effective_gridpoints < _right))
+            mask &= gp_rows[:, idim] >= _left - self.r[dim] + 1
+            mask &= gp_rows[:, idim] < _right
 
-            which = np.nonzero(mask)
-            active_mrow = active_mrow[which]
-            active_mcol = active_mcol[which]
-            active_mval = active_mval[which]
+        which = np.flatnonzero(mask)
+        active_mrow = scattered_mrow[which]
+        active_mcol = scattered_mcol[which]
+        active_mval = scattered_mval[which]
 
         # then, zero any of the coefficients which refer to points outside our
         # domain.  Do this on all the gridpoints for now, since this is a hack
         # anyway
-        for idim, (dim, mycoord) in enumerate(zip(
-                self.grid.dimensions, distributor.mycoords)):
-            _left = distributor.decomposition[idim][mycoord][0]
-            _right = distributor.decomposition[idim][mycoord][-1] + 1
-
-            # points to the left have the first few coeffs zeroed
+        for idim, (dim, (_left, _right)) in enumerate(zip(
+                self.grid.dimensions, local_bounds)):
             this_dim_r = self.r[dim]
             effective_gridpoints = scattered_gp[:, idim]
             if this_dim_r is None:
                 this_dim_r = self.grid.dimension_map[dim].glb
                 effective_gridpoints = np.zeros_like(effective_gridpoints)
 
-            trim_size = np.clip(_left - effective_gridpoints, 0, this_dim_r)
-            for ir in range(this_dim_r):
-                # which points need zeroing?
-                mask = (trim_size > ir)
-                scattered_coeffs[idim][mask, ir] = 0
-
-            # points to the right have the last few coeffs zeroed
-            trim_size = np.clip(
+            # points to the left have the first few coeffs zeroed, and points
+            # to the right have the last few coeffs zeroed
+            trim_left = np.clip(_left - effective_gridpoints, 0, this_dim_r)
+            trim_right = np.clip(
                 effective_gridpoints - (_right - this_dim_r), 0, this_dim_r)
-            for ir in range(this_dim_r):
-                # which points need zeroing?
-                mask = (trim_size > ir)
-                scattered_coeffs[idim][mask, -(ir+1)] = 0
+
+            # which coeffs need zeroing? All of them, on both sides, are masked
+            # at once through the comparison of their index with the trim sizes
+            # of their point, so the coeffs are swept only once
+            coeff_index = np.arange(this_dim_r)
+            mask = ((coeff_index < trim_left[:, None]) |
+                    (coeff_index[::-1] < trim_right[:, None]))
+            scattered_coeffs[idim][mask] = 0
 
             # finally, we translate to local coordinates
             # no need for this in the broadcasted Dimensions
@@ -2071,10 +2636,8 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
                 self.interpolation_coefficients[d]: scattered_coeffs[idim]
                 for idim, d in enumerate(self.grid.dimensions)
             },
-            self.mrow: active_mrow,
-            self.mcol: active_mcol,
-            self.mval: active_mval,
-            **self._build_par_dim_to_nnz(scattered_gp, active_mrow),
+            **self._build_par_dim_to_nnz(scattered_gp, active_mrow, active_mcol,
+                                         active_mval),
         }
 
     def _dist_scatter(self, data=None):
@@ -2094,30 +2657,39 @@ class MatrixSparseTimeFunction(AbstractSparseTimeFunction):
             raise NotImplementedError("Don't know how to gather data from an "
                                       "object of type `%s`" % type(key))
 
-    def manual_gather(self):
+    def manual_gather(self, *, wait=True):
+        """
+        Sum the data computed by all ranks into the data on rank 0.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            If False, the reduction is only started, and the MPI request is
+            returned, so that the caller may overlap it with other work. The
+            data on rank 0 may only be read after the request has completed.
+            Without MPI, an already completed request is returned. Defaults
+            to True.
+        """
         # data, in this case, is set to whatever dist_scatter provided?
         # on rank 0, this is the original data array (hack...)
         distributor = self._distributor
 
         # If not using MPI, don't waste time
         if distributor.nprocs == 1:
-            return
+            return None if wait else CompletedRequest()
 
         # This relies on all ranks having a copy of all data. Which feels "bad".
+        # Note: on rank 0 data === scattered_data, hence the reduction is
+        # carried out in place
         if distributor.myrank != 0:
-            distributor.comm.Reduce(
-                self.scattered_data,
-                None,
-                op=MPI.SUM,
-                root=0
-            )
+            sendbuf, recvbuf = self.scattered_data, None
         else:
-            distributor.comm.Reduce(
-                MPI.IN_PLACE,
-                self.scattered_data,  # Note: on rank 0 data === scattered_data.
-                op=MPI.SUM,
-                root=0
-            )
+            sendbuf, recvbuf = MPI.IN_PLACE, self.scattered_data
+        req = distributor.comm.Ireduce(sendbuf, recvbuf, op=MPI.SUM, root=0)
+
+        if not wait:
+            return req
+        req.Wait()
 
     def _dist_gather(self, data):
         pass
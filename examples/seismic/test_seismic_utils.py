@@ -94,3 +94,23 @@ def test_geom(shape):
 
     assert geometry.new_rec(name="bonjour").name == "bonjour"
     assert geometry.new_src(name="bonjour").name == "bonjour"
+
+
+@pytest.mark.parametrize('dt', [0.5, 2.])
+def test_geom_resample(dt):
+    shape = (21, 21)
+    vp = np.ones(shape)
+    model = Model((0, 0), (10, 10), shape, 4, vp, nbl=20, dt=1)
+
+    geometry = setup_geometry(model, 250)
+    assert geometry.nt == 251
+    assert np.allclose(geometry.time_axis.time_values, np.linspace(0, 250, 251))
+
+    # The time axis must follow the new `dt`
+    assert geometry.resample(dt) is geometry
+    nt = int(250 / dt) + 1
+    assert geometry.dt == dt
+    assert geometry.nt == nt
+    assert np.allclose(geometry.time_axis.time_values, np.linspace(0, 250, nt))
+    assert geometry.rec.shape == (nt, geometry.nrec)
+    assert geometry.src.shape == (nt, 1)
@@ -1,5 +1,6 @@
 import numpy as np
 from argparse import Action, ArgumentError, ArgumentParser
+from functools import lru_cache
 
 from devito import error, configuration, warning
 from devito.tools import Pickable
@@ -10,8 +11,9 @@ __all__ = ['AcquisitionGeometry', 'setup_geometry', 'seismic_args']
 
 
 def setup_geometry(model, tn, f0=0.010):
-    # Source and receiver geometries
-    src_coordinates = np.empty((1, model.dim))
+    # Source and receiver geometries. The coordinates are created straight in
+    # the model's dtype, so that they needn't be converted later on
+    src_coordinates = np.empty((1, model.dim), dtype=model.dtype)
     src_coordinates[0, :] = np.array(model.domain_size) * .5
     if model.dim > 1:
         src_coordinates[0, -1] = model.origin[-1] + model.spacing[-1]
@@ -26,23 +28,23 @@ def setup_geometry(model, tn, f0=0.010):
 
 def setup_rec_coords(model):
     nrecx = model.shape[0]
-    recx = np.linspace(model.origin[0], model.domain_size[0], nrecx)
+    recx = np.linspace(model.origin[0], model.domain_size[0], nrecx,
+                       dtype=model.dtype)
 
     if model.dim == 1:
         return recx.reshape((nrecx, 1))
     elif model.dim == 2:
-        rec_coordinates = np.empty((nrecx, model.dim))
+        rec_coordinates = np.empty((nrecx, model.dim), dtype=model.dtype)
         rec_coordinates[:, 0] = recx
         rec_coordinates[:, -1] = model.origin[-1] + 2 * model.spacing[-1]
         return rec_coordinates
     else:
         nrecy = model.shape[1]
-        recy = np.linspace(model.origin[1], model.domain_size[1], nrecy)
-        rec_coordinates = np.empty((nrecx*nrecy, model.dim))
-        rec_coordinates[:, 0] = np.array([recx[i] for i in range(nrecx)
-                                          for j in range(nrecy)])
-        rec_coordinates[:, 1] = np.array([recy[j] for i in range(nrecx)
-                                          for j in range(nrecy)])
+        recy = np.linspace(model.origin[1], model.domain_size[1], nrecy,
+                           dtype=model.dtype)
+        rec_coordinates = np.empty((nrecx*nrecy, model.dim), dtype=model.dtype)
+        rec_coordinates[:, 0] = np.repeat(recx, nrecy)
+        rec_coordinates[:, 1] = np.tile(recy, nrecx)
         rec_coordinates[:, -1] = model.origin[-1] + 2 * model.spacing[-1]
         return rec_coordinates
 
@@ -85,14 +87,16 @@ class AcquisitionGeometry(Pickable):
         self._dt = model.critical_dt
         self._t0 = t0
         self._tn = tn
+        self._time_axis = TimeAxis(start=t0, stop=tn, step=self._dt)
 
     def resample(self, dt):
         self._dt = dt
+        self._time_axis = TimeAxis(start=self.t0, stop=self.tn, step=dt)
         return self
 
     @property
     def time_axis(self):
-        return TimeAxis(start=self.t0, stop=self.tn, step=self.dt)
+        return self._time_axis
 
     @property
     def src_type(self):
@@ -183,34 +187,36 @@ class AcquisitionGeometry(Pickable):
 sources = {'Wavelet': WaveletSource, 'Ricker': RickerSource, 'Gabor': GaborSource}
 
 
-def seismic_args(description):
+class _dtype_store(Action):
+    def __call__(self, parser, args, values, option_string=None):
+        values = {'float32': np.float32, 'float64': np.float64}[values]
+        setattr(args, self.dest, values)
+
+
+class _opt_action(Action):
+    def __call__(self, parser, args, values, option_string=None):
+        try:
+            # E.g., `('advanced', {'par-tile': True})`
+            values = eval(values)
+            if not isinstance(values, tuple) and len(values) >= 1:
+                raise ArgumentError(self, ("Invalid choice `%s` (`opt` must be "
+                                           "either str or tuple)" % str(values)))
+            opt = values[0]
+        except NameError:
+            # E.g. `'advanced'`
+            opt = values
+        if opt not in configuration._accepted['opt']:
+            raise ArgumentError(self, ("Invalid choice `%s` (choose from %s)"
+                                       % (opt, str(configuration._accepted['opt']))))
+        setattr(args, self.dest, values)
+
+
+@lru_cache(maxsize=None)
+def _seismic_parser():
     """
-    Command line options for the seismic examples
+    The parser of the options shared by all seismic examples, built only once.
     """
-
-    class _dtype_store(Action):
-        def __call__(self, parser, args, values, option_string=None):
-            values = {'float32': np.float32, 'float64': np.float64}[values]
-            setattr(args, self.dest, values)
-
-    class _opt_action(Action):
-        def __call__(self, parser, args, values, option_string=None):
-            try:
-                # E.g., `('advanced', {'par-tile': True})`
-                values = eval(values)
-                if not isinstance(values, tuple) and len(values) >= 1:
-                    raise ArgumentError(self, ("Invalid choice `%s` (`opt` must be "
-                                               "either str or tuple)" % str(values)))
-                opt = values[0]
-            except NameError:
-                # E.g. `'advanced'`
-                opt = values
-            if opt not in configuration._accepted['opt']:
-                raise ArgumentError(self, ("Invalid choice `%s` (choose from %s)"
-                                           % (opt, str(configuration._accepted['opt']))))
-            setattr(args, self.dest, values)
-
-    parser = ArgumentParser(description=description)
+    parser = ArgumentParser(add_help=False)
     parser.add_argument("-nd", dest="ndim", default=3, type=int,
                         help="Number of dimensions")
     parser.add_argument("-d", "--shape", default=(51, 51, 51), type=int, nargs="+",
@@ -235,3 +241,13 @@ def seismic_args(description):
     parser.add_argument("-dtype", action=_dtype_store, dest="dtype", default=np.float32,
                         choices=['float32', 'float64'])
     return parser
+
+
+def seismic_args(description):
+    """
+    Command line options for the seismic examples.
+
+    A new parser is returned at each call, so that the caller may extend it with
+    its own options, while the shared options are only set up once.
+    """
+    return ArgumentParser(description=description, parents=[_seismic_parser()])
@@ -458,6 +458,47 @@ class TestSparseFunction(object):
         ownership = grid.distributor.glb_to_rank(sf.gridpoints)
         assert list(ownership.keys()) == [grid.distributor.myrank]
 
+    @pytest.mark.parallel(mode=4)
+    def test_dist_count_sparse(self):
+        """Check that the nonblocking consensus exchanging the sparse point
+        counts yields the same counts as a dense Alltoall."""
+        grid = Grid(shape=(8, 8))
+        comm = grid.distributor.comm
+
+        sf = SparseFunction(name='sf', grid=grid, npoint=1)
+
+        for ssparse in [np.zeros(4, dtype=int),
+                        np.arange(4)*(comm.rank % 2),
+                        np.array([1, 0, 2, 4]) + comm.rank]:
+            expected = np.empty(comm.size, dtype=int)
+            comm.Alltoall(ssparse, expected)
+
+            assert np.all(sf._dist_count_sparse(ssparse) == expected)
+
+    @pytest.mark.parallel(mode=4)
+    @pytest.mark.parametrize('sparsity', [0., 2.])
+    @pytest.mark.parametrize('extent', [19.5, 4.5])
+    def test_dist_neighborhood(self, sparsity, extent):
+        """Check that exchanging the sparse points through neighborhood
+        collectives, rather than Alltoallv, yields the same results. With
+        `extent=4.5`, all sparse points fall within the same MPI rank, that is
+        all MPI ranks send their sparse points to a single one."""
+        grid = Grid(shape=(21, 21), extent=(20., 20.))
+        x, y = np.meshgrid(np.arange(21.), np.arange(21.), indexing='ij')
+
+        f = Function(name='f', grid=grid)
+        f.data[:] = x + 100*y
+
+        coords = np.random.default_rng(0).random((8, 2))*extent
+        sf = SparseFunction(name='sf', grid=grid, npoint=8, coordinates=coords)
+        sf._dist_count_sparsity = sparsity
+
+        Operator(sf.interpolate(f))()
+
+        assert (sf._dist_topology is None) == (sparsity == 0.)
+        coords = sf.coordinates.data
+        assert np.allclose(sf.data, coords[:, 0] + 100*coords[:, 1], rtol=1e-5)
+
     @pytest.mark.parallel(mode=4)
     @pytest.mark.parametrize('coords,expected,expectedinds', [
         ([(0.5, 0.5), (1.5, 2.5), (1.5, 1.5), (2.5, 1.5)], [[0.], [1.], [2.], [3.]],
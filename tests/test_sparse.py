@@ -289,6 +289,59 @@ class TestMatrixSparseTimeFunction(object):
 
         assert np.all(m.data[1] == expected_data1)
 
+    @pytest.mark.parametrize("rxy", [
+        # 8 grid points per location, at the unrolling threshold
+        (2, 4),
+        # 9 grid points per location, just above the unrolling threshold
+        (3, 3),
+    ])
+    @pytest.mark.parametrize("unroll", [False, True])
+    def test_precomputed_subpoints_interpolate(self, rxy, unroll):
+        shape = (101, 101)
+        grid = Grid(shape=shape)
+        x, y = grid.dimensions
+        r = {x: rxy[0], y: rxy[1]}
+
+        nt = 10
+
+        m = TimeFunction(name="m", grid=grid, space_order=0, save=None, time_order=1)
+        m.data[:] = np.random.default_rng(0).random(m.data.shape)
+
+        # Single two-component source with distinct coefficients
+        matrix = scipy.sparse.coo_matrix(np.array([[1], [2]], dtype=np.float32))
+        sf = MatrixSparseTimeFunction(name="s", grid=grid, r=r, matrix=matrix, nt=nt)
+
+        # Force the loops over the radius Dimensions to be, or not to be, unrolled,
+        # regardless of the default threshold
+        sf._interpolate_unroll = np.prod(rxy) if unroll else np.prod(rxy) - 1
+
+        sf.gridpoints.data[0, :] = 40
+        sf.gridpoints.data[1, :] = 39
+        for d in grid.dimensions:
+            coeffs = 1.0 + np.arange(r[d])
+            sf.interpolation_coefficients[d].data[0, :] = coeffs
+            sf.interpolation_coefficients[d].data[1, :] = coeffs[::-1]
+
+        op = Operator(sf.interpolate(m))
+
+        sf.manual_scatter()
+        op(time_m=0, time_M=0)
+        sf.manual_gather()
+
+        check_coeffs = self._pure_python_coeffs(sf)
+        expected = np.tensordot(check_coeffs, m.data[0], axes=2)
+
+        assert np.all(sf.data[0, :] == pytest.approx(expected))
+
+    def test_reorder_by_locality(self):
+        grid = Grid(shape=(11, 11))
+        matrix = scipy.sparse.coo_matrix(np.eye(2, dtype=np.float32))
+        sf = MatrixSparseTimeFunction(name="s", grid=grid, r=2, matrix=matrix, nt=3)
+        sf.gridpoints.data[:] = [[5, 5], [1, 1]]
+
+        with pytest.raises(NotImplementedError):
+            sf.reorder_by_locality()
+
     def test_precomputed_subpoints_inject_dt2(self):
         shape = (101, 101)
         grid = Grid(shape=shape)
@@ -400,6 +453,67 @@ class TestMatrixSparseTimeFunction(object):
         if grid.distributor.myrank == 0:
             assert sf.data[0, 0] == -3.0  # 1 * (1 * 1) * 1 + (-1) * (2 * 2) * 1
 
+    @pytest.mark.parallel(mode=4)
+    def test_rank_to_points(self):
+        shape = (20, 24)
+        grid = Grid(shape=shape)
+        distributor = grid.distributor
+        r = 2
+        npoint = 300
+
+        matrix = scipy.sparse.eye(npoint, dtype=np.float32)
+        sf = MatrixSparseTimeFunction(name="s", grid=grid, r=r, matrix=matrix, nt=2)
+
+        rng = np.random.default_rng(0)
+        gridpoints = np.stack([rng.integers(0, s - r + 1, npoint) for s in shape],
+                              axis=1)
+        sf.gridpoints.data[:] = gridpoints
+
+        rank_to_points = sf._rank_to_points()
+        assert len(rank_to_points) == distributor.nprocs
+
+        # A point must be injected into a rank iff its stencil overlaps the
+        # rank's domain along all Dimensions
+        for rank, points in enumerate(rank_to_points):
+            assert points.dtype == np.int32
+            coords = distributor.comm.Get_coords(rank)
+            expected = np.ones(npoint, dtype=bool)
+            for idim, c in enumerate(coords):
+                decomp = distributor.decomposition[idim][c]
+                expected &= ((gridpoints[:, idim] + r - 1 >= decomp[0]) &
+                             (gridpoints[:, idim] <= decomp[-1]))
+            assert np.all(np.sort(points) == np.flatnonzero(expected))
+
+    @pytest.mark.parallel(mode=[1, 4])
+    def test_manual_gather_nowait(self):
+        grid = Grid(shape=(20, 20))
+        distributor = grid.distributor
+        npoint = 3
+        nt = 2
+
+        if distributor.myrank == 0:
+            matrix = scipy.sparse.eye(npoint, dtype=np.float32)
+        else:
+            matrix = scipy.sparse.coo_matrix((0, 0), dtype=np.float32)
+
+        sfs = [MatrixSparseTimeFunction(name="s%d" % i, grid=grid, r=2,
+                                        matrix=matrix, nt=nt)
+               for i in range(2)]
+
+        values = np.arange(nt*npoint, dtype=np.float32).reshape(nt, npoint)
+        for sf in sfs:
+            sf.manual_scatter()
+            sf.scattered_data[:] = (distributor.myrank + 1)*values
+
+        sfs[0].manual_gather()
+        req = sfs[1].manual_gather(wait=False)
+        req.Wait()
+
+        if distributor.myrank == 0:
+            expected = sum(range(1, distributor.nprocs + 1))*values
+            assert np.all(sfs[0].data == expected)
+            assert np.all(sfs[1].data == sfs[0].data)
+
 
 class TestSparseFunction(object):
 
@@ -456,6 +570,64 @@ class TestSparseFunction(object):
                 assert getattr(sps, subf).indices[0] == new_spdim
                 assert np.all(getattr(sps, subf).data == getattr(sp, subf).data)
 
+    @pytest.mark.parametrize('sptype', _sptypes)
+    def test_reorder_by_locality(self, sptype):
+        grid = Grid((11, 11), extent=(10, 10))
+        npoint = 20
+        coords = np.random.rand(npoint, 2)*10
+        sp = sptype(name="s", grid=grid, npoint=npoint, nt=3, r=1,
+                    interpolation_coeffs=np.random.randn(npoint, 2, 2),
+                    coordinates=coords)
+        sp.data[:] = np.arange(npoint)
+        coeffs = getattr(sp, 'interpolation_coeffs', None)
+        if coeffs is not None:
+            coeffs = np.array(coeffs.data)
+
+        perm = sp.reorder_by_locality()
+
+        assert np.all(np.sort(perm) == np.arange(npoint))
+        assert np.all(sp.data == perm)
+        assert np.allclose(sp.coordinates.data, coords[perm])
+        if coeffs is not None:
+            assert np.allclose(sp.interpolation_coeffs.data, coeffs[perm])
+
+        # The sparse points within the same grid cell are now contiguous
+        ci = sp._coords_indices
+        nruns = 1 + np.count_nonzero(np.any(np.diff(ci, axis=0), axis=1))
+        assert nruns == len(np.unique(ci, axis=0))
+
+    def test_pos_symbols(self):
+        grid = Grid((11, 11))
+        sp0 = SparseFunction(name="s0", grid=grid, npoint=1)
+        sp1 = SparseTimeFunction(name="s1", grid=grid, npoint=2, nt=3)
+
+        # The position Symbols are shared by all sparse functions over a grid
+        assert [p.name for p in sp0._pos_symbols] == ['posx', 'posy']
+        assert all(p0 is p1 for p0, p1 in zip(sp0._pos_symbols, sp1._pos_symbols))
+
+    def test_dist_buffer(self):
+        grid = Grid((11, 11))
+        sp = SparseTimeFunction(name="s", grid=grid, npoint=4, nt=3)
+
+        b0 = sp._dist_buffer('key', (4, 3), np.float32)
+        assert b0.shape == (4, 3)
+
+        # Smaller or equal requests reuse the same memory
+        b1 = sp._dist_buffer('key', (2, 3), np.float32)
+        assert b1.shape == (2, 3)
+        assert np.shares_memory(b0, b1)
+
+        # Larger requests, or requests with a different dtype, do not
+        b2 = sp._dist_buffer('key', (5, 3), np.float32)
+        assert not np.shares_memory(b0, b2)
+        b3 = sp._dist_buffer('key', (2, 3), np.float64)
+        assert b3.dtype == np.float64
+        assert not np.shares_memory(b2, b3)
+
+        # Distinct keys never share memory
+        b4 = sp._dist_buffer('other', (2, 3), np.float64)
+        assert not np.shares_memory(b3, b4)
+
     @switchconfig(safe_math=True)
     @pytest.mark.parallel(mode=[1, 4])
     def test_mpi_no_data(self):